@@ -138,7 +138,7 @@ def main():
         results.append(result)
 
     # Compute metrics
-    metrics = BenchmarkMetrics(results)
+    metrics = BenchmarkMetrics.from_records(results)
 
     print()
     print("=" * 60)
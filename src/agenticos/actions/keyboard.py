@@ -5,17 +5,53 @@ Handles text typing, key presses, hotkey combinations via pyautogui.
 
 from __future__ import annotations
 
+import ctypes
 import time
 from typing import Optional
 
 import pyautogui
 
-from agenticos.utils.exceptions import ActionError
+from agenticos.utils.exceptions import ActionError, PartialInputError
 
 # Safety: disable pyautogui's fail-safe only when explicitly asked
 pyautogui.FAILSAFE = True
 pyautogui.PAUSE = 0.05
 
+# SendInput constants for KEYEVENTF_UNICODE typing (Windows only)
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_UNICODE = 0x0004
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # Only here so the INPUT union has its full Win32 size
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
 
 class KeyboardExecutor:
     """Executes keyboard actions on the OS.
@@ -88,6 +124,41 @@ class KeyboardExecutor:
         except Exception as e:
             raise ActionError(f"Failed to type unicode text: {e}") from e
 
+    def send_text(self, text: str) -> None:
+        """Type text instantly with a single SendInput call.
+
+        Each UTF-16 code unit becomes a KEYEVENTF_UNICODE down/up pair, so
+        the whole string is injected in one syscall with no per-key delay.
+        Intended for short, printable strings; use type_unicode for visible
+        real-time typing.
+
+        Args:
+            text: Text to type.
+
+        Raises:
+            PartialInputError: If SendInput injected only some of the events.
+            ActionError: If SendInput is unavailable or injected nothing.
+        """
+        units = memoryview(text.encode("utf-16-le")).cast("H")
+        inputs = (_INPUT * (2 * len(units)))()
+        for i, unit in enumerate(units):
+            down, up = inputs[2 * i], inputs[2 * i + 1]
+            down.type = up.type = _INPUT_KEYBOARD
+            down.u.ki.wScan = up.u.ki.wScan = unit
+            down.u.ki.dwFlags = _KEYEVENTF_UNICODE
+            up.u.ki.dwFlags = _KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP
+
+        try:
+            sent = ctypes.windll.user32.SendInput(  # type: ignore[attr-defined]
+                len(inputs), inputs, ctypes.sizeof(_INPUT)
+            )
+        except AttributeError as e:
+            raise ActionError("SendInput is only available on Windows") from e
+        if sent == 0:
+            raise ActionError("SendInput injected no events")
+        if sent != len(inputs):
+            raise PartialInputError(f"SendInput injected {sent} of {len(inputs)} events")
+
     def press(self, key: str) -> None:
         """Press and release a single key.
 
@@ -6,6 +6,7 @@ Runs PowerShell and CMD commands with safety checks and output capture.
 from __future__ import annotations
 
 import asyncio
+import re
 import subprocess
 import time
 from dataclasses import dataclass
@@ -14,6 +15,15 @@ from typing import Optional
 from agenticos.utils.config import get_config
 from agenticos.utils.exceptions import ActionBlockedError, ActionError
 
+# Built-in GUI apps launched directly, skipping a PowerShell cold start.
+# Console programs (cmd, powershell) go through Start-Process so they get a window.
+_DIRECT_APPS = {
+    "notepad": "notepad.exe",
+    "calc": "calc.exe",
+    "explorer": "explorer.exe",
+    "mspaint": "mspaint.exe",
+}
+
 
 @dataclass
 class ShellResult:
@@ -82,6 +92,9 @@ class ShellExecutor:
         else:
             config = get_config()
             self.blocked_commands = config.blocked_commands
+        # Patterns the compiled regex was built from, and the regex itself
+        self._blocked_key: Optional[tuple[str, ...]] = None
+        self._blocked_re: Optional[re.Pattern[str]] = None
 
     def run(
         self,
@@ -210,8 +223,34 @@ class ShellExecutor:
 
         Returns:
             ShellResult.
+
+        Raises:
+            ActionBlockedError: If the launch command matches a blocked pattern.
         """
-        return self.run(f"Start-Process '{app_name}'")
+        command = f"Start-Process '{app_name}'"
+        self._check_blocked(command)
+
+        executable = _DIRECT_APPS.get(app_name.strip().lower())
+        if executable is not None:
+            start = time.perf_counter()
+            try:
+                process = subprocess.Popen(
+                    [executable],
+                    creationflags=getattr(subprocess, "DETACHED_PROCESS", 0),
+                    close_fds=True,
+                )
+            except OSError:
+                pass  # Fall back to Start-Process below
+            else:
+                return ShellResult(
+                    command=executable,
+                    stdout="",
+                    stderr="",
+                    # Still running, or a launcher stub that already handed off
+                    return_code=process.poll() or 0,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                )
+        return self.run(command)
 
     def _check_blocked(self, command: str) -> None:
         """Check if a command matches any blocked pattern.
@@ -222,10 +261,34 @@ class ShellExecutor:
         Raises:
             ActionBlockedError: If command is blocked.
         """
-        cmd_lower = command.lower().strip()
-        for blocked in self.blocked_commands:
-            if blocked.lower() in cmd_lower:
-                raise ActionBlockedError(
-                    f"Command blocked by safety policy: '{command}' "
-                    f"(matches blocked pattern: '{blocked}')"
-                )
+        pattern = self._blocked_pattern()
+        if pattern is None:
+            return
+        match = pattern.search(command)
+        if match is not None:
+            blocked = next(
+                (p for p in self.blocked_commands if p.lower() == match.group(0).lower()),
+                match.group(0),
+            )
+            raise ActionBlockedError(
+                f"Command blocked by safety policy: '{command}' "
+                f"(matches blocked pattern: '{blocked}')"
+            )
+
+    def _blocked_pattern(self) -> Optional[re.Pattern[str]]:
+        """Return one case-insensitive alternation of the blocked patterns.
+
+        The regex scans each command once however many patterns there are.
+        It is rebuilt whenever ``blocked_commands`` changes, whether it was
+        reassigned or edited in place.
+
+        Returns:
+            Compiled pattern, or None if nothing is blocked.
+        """
+        key = tuple(self.blocked_commands)
+        if key != self._blocked_key:
+            self._blocked_key = key
+            self._blocked_re = (
+                re.compile("|".join(map(re.escape, key)), re.IGNORECASE) if key else None
+            )
+        return self._blocked_re
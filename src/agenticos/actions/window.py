@@ -66,7 +66,9 @@ class WindowManager:
 
             for win in desktop.windows():
                 try:
-                    if visible_only and not win.is_visible():
+                    # Each wrapper query is a cross-process UIA call; ask once
+                    visible = win.is_visible()
+                    if visible_only and not visible:
                         continue
 
                     rect = win.rectangle()
@@ -78,7 +80,7 @@ class WindowManager:
                             handle=getattr(info, "handle", 0) or 0,
                             pid=getattr(info, "process_id", 0) or 0,
                             bbox=(rect.left, rect.top, rect.right, rect.bottom),
-                            is_visible=win.is_visible(),
+                            is_visible=visible,
                             is_minimized=win.is_minimized(),
                             is_maximized=win.is_maximized(),
                             class_name=getattr(info, "class_name", "") or "",
@@ -93,6 +93,10 @@ class TaskPlan:
         """Whether all steps are completed."""
         return all(s.completed for s in self.steps)
 
+    def mark_complete(self, index: int) -> None:
+        """Mark the step at ``index`` as completed."""
+        self.steps[index].completed = True
+
     def mark_current_complete(self) -> None:
         """Mark the current step as completed."""
         step = self.current_step
@@ -183,7 +183,8 @@ def main(
     Chat with an AI agent that controls your Windows desktop.
     Type natural language tasks and watch them execute in real time.
     """
-    config = get_config()
+    # Overrides go on a copy so the shared cached config stays untouched
+    config = get_config().model_copy(deep=True)
 
     # Apply CLI overrides
     if model:
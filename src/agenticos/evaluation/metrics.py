@@ -7,14 +7,36 @@ step efficiency, grounding accuracy, time-to-complete, and cost.
 from __future__ import annotations
 
 import json
-import statistics
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:  # optional speedup
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Numeric TaskResult fields, laid out as columns for vectorized aggregation
+_COLUMNS_DTYPE = np.dtype([
+    ("success", np.bool_),
+    ("steps", np.int32),
+    ("efficiency", np.float64),
+    ("elapsed", np.float64),
+    ("grounding", np.float64),
+    ("cost", np.float64),
+])
+
+
+@dataclass(slots=True)
 class TaskResult:
     """Result of a single benchmark task evaluation.
 
@@ -89,10 +111,39 @@ class BenchmarkMetrics:
     benchmark_name: str = ""
     timestamp: float = field(default_factory=time.time)
 
+    @classmethod
+    def from_records(cls, records: Iterable[TaskResult], **kwargs: Any) -> BenchmarkMetrics:
+        """Build metrics from an iterable of finished results.
+
+        Args:
+            records: Task results to aggregate.
+            **kwargs: Other fields, e.g. ``model_name`` or ``benchmark_name``.
+
+        Returns:
+            BenchmarkMetrics over ``records``.
+        """
+        return cls(list(records), **kwargs)
+
     def add_result(self, result: TaskResult) -> None:
         """Add a task result to the metrics."""
         self.results.append(result)
 
+    def _columns(self) -> np.ndarray:
+        """Numeric result fields as a structured array, one column per metric.
+
+        Built fresh on every call, since ``results`` and its entries may be
+        edited in place at any time.
+        """
+        return np.fromiter(
+            (
+                (r.success, r.steps_taken, r.step_efficiency, r.elapsed_seconds,
+                 r.grounding_accuracy, r.cost_usd)
+                for r in self.results
+            ),
+            dtype=_COLUMNS_DTYPE,
+            count=len(self.results),
+        )
+
     # ── Core Metrics ─────────────────────────────────────────────────
 
     @property
@@ -100,55 +151,60 @@ class BenchmarkMetrics:
         """Overall success rate (primary metric)."""
         if not self.results:
             return 0.0
-        return sum(1 for r in self.results if r.success) / len(self.results)
+        return float(self._columns()["success"].mean())
 
     @property
     def mean_step_efficiency(self) -> float:
         """Mean step efficiency across successful tasks."""
-        successful = [r for r in self.results if r.success]
-        if not successful:
+        cols = self._columns()
+        efficiency = cols["efficiency"][cols["success"]]
+        if not len(efficiency):
             return 0.0
-        return statistics.mean(r.step_efficiency for r in successful)
+        return float(efficiency.mean())
 
     @property
     def mean_time(self) -> float:
         """Mean time-to-complete in seconds."""
         if not self.results:
             return 0.0
-        return statistics.mean(r.elapsed_seconds for r in self.results)
+        return float(self._columns()["elapsed"].mean())
 
     @property
     def mean_grounding_accuracy(self) -> float:
         """Mean grounding accuracy."""
-        accuracies = [r.grounding_accuracy for r in self.results if r.grounding_accuracy > 0]
-        if not accuracies:
+        grounding = self._columns()["grounding"]
+        accuracies = grounding[grounding > 0]
+        if not len(accuracies):
             return 0.0
-        return statistics.mean(accuracies)
+        return float(accuracies.mean())
 
     @property
     def total_cost(self) -> float:
         """Total API cost in USD."""
-        return sum(r.cost_usd for r in self.results)
+        return float(self._columns()["cost"].sum())
 
     @property
     def mean_steps(self) -> float:
         """Mean steps per task."""
         if not self.results:
             return 0.0
-        return statistics.mean(r.steps_taken for r in self.results)
+        return float(self._columns()["steps"].mean())
 
     # ── Category Breakdown ───────────────────────────────────────────
 
+    def _category_stats(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Per-category task and success counts, categories in sorted order."""
+        if not self.results:
+            return [], np.zeros(0, np.int64), np.zeros(0)
+        categories, ids = np.unique([r.category for r in self.results], return_inverse=True)
+        totals = np.bincount(ids)
+        successes = np.bincount(ids, weights=self._columns()["success"])
+        return categories.tolist(), totals, successes
+
     def success_rate_by_category(self) -> dict[str, float]:
         """Success rate broken down by task category."""
-        categories: dict[str, list[bool]] = {}
-        for r in self.results:
-            categories.setdefault(r.category, []).append(r.success)
-
-        return {
-            cat: sum(results) / len(results)
-            for cat, results in categories.items()
-        }
+        categories, totals, successes = self._category_stats()
+        return dict(zip(categories, (successes / totals).tolist()))
 
     def error_analysis(self) -> dict[str, int]:
         """Count errors by category."""
@@ -177,12 +233,11 @@ class BenchmarkMetrics:
         ]
 
         # Category breakdown
-        categories = self.success_rate_by_category()
+        categories, totals, successes = self._category_stats()
         if categories:
             lines.append(f"\n── By Category ──")
-            for cat, rate in sorted(categories.items()):
-                count = sum(1 for r in self.results if r.category == cat)
-                lines.append(f"  {cat:20s}: {rate:.1%} ({count} tasks)")
+            for cat, count, successful in zip(categories, totals.tolist(), successes.tolist()):
+                lines.append(f"  {cat:20s}: {successful / count:.1%} ({count} tasks)")
 
         # Error analysis
         errors = self.error_analysis()
@@ -227,8 +282,7 @@ class BenchmarkMetrics:
         """
         output = Path(path)
         output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        output.write_bytes(_json_dumps_pretty(self.to_dict()))
         return str(output)
 
     def to_markdown_table(self) -> str:
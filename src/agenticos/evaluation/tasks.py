@@ -6,13 +6,15 @@ for evaluating AgenticOS performance.
 
 from __future__ import annotations
 
+import functools
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkTask:
     """A single benchmark task for evaluation.
 
@@ -60,6 +62,62 @@ class BenchmarkTask:
         }
 
 
+_OPEN_DESC = "Open the {app} application."
+_VISIBLE_VERIF = "{app} window is visible"
+_KILL_CMD = "taskkill /im {process} /f 2>$null"
+
+
+def _simple_open_task(
+    task_id: str,
+    app: str,
+    domain: str,
+    process: str,
+    description: Optional[str] = None,
+    cleanup_commands: Optional[list[str]] = None,
+) -> BenchmarkTask:
+    """Build a one-step "open this app" basic task from the shared templates.
+
+    Args:
+        task_id: Unique task identifier.
+        app: Display name of the application (e.g., 'Notepad').
+        domain: Application domain.
+        process: Executable name killed during cleanup.
+        description: Overrides the templated instruction when the wording differs.
+        cleanup_commands: Overrides the templated taskkill cleanup.
+
+    Returns:
+        The constructed BenchmarkTask.
+    """
+    return BenchmarkTask(
+        task_id=task_id,
+        name=f"Open {app}",
+        description=description or _OPEN_DESC.format(app=app),
+        category="basic",
+        domain=domain,
+        optimal_steps=1,
+        cleanup_commands=cleanup_commands or [_KILL_CMD.format(process=process)],
+        verification=_VISIBLE_VERIF.format(app=app),
+    )
+
+
+def _memoized_suite(build: Callable[[type], BenchmarkSuite]) -> Callable[[type], BenchmarkSuite]:
+    """Build a built-in suite once per class and hand out copies of it.
+
+    The task objects are shared between calls, so treat built-in tasks as
+    read-only; each call still gets its own ``tasks`` list to filter or extend.
+    """
+    cache: dict[type, BenchmarkSuite] = {}
+
+    @functools.wraps(build)
+    def wrapper(cls: type) -> BenchmarkSuite:
+        suite = cache.get(cls)
+        if suite is None:
+            suite = cache[cls] = build(cls)
+        return cls(name=suite.name, description=suite.description, tasks=list(suite.tasks))
+
+    return wrapper
+
+
 @dataclass
 class BenchmarkSuite:
     """A collection of benchmark tasks.
@@ -85,6 +143,14 @@ class BenchmarkSuite:
         """Filter tasks by application domain."""
         return [t for t in self.tasks if t.domain == domain]
 
+    def count_by_category(self) -> dict[str, int]:
+        """Count tasks per category in a single pass."""
+        return dict(Counter(t.category for t in self.tasks))
+
+    def count_by_domain(self) -> dict[str, int]:
+        """Count tasks per application domain in a single pass."""
+        return dict(Counter(t.domain for t in self.tasks))
+
     def save_json(self, path: str) -> str:
         """Save suite to JSON file."""
         output = Path(path)
@@ -104,10 +170,12 @@ class BenchmarkSuite:
         with open(path) as f:
             data = json.load(f)
 
-        tasks = [
-            BenchmarkTask(**{k: v for k, v in t.items() if k != "verification_func"})
-            for t in data.get("tasks", [])
-        ]
+        # The decoded dicts are discarded afterwards, so strip the callable
+        # field in place rather than copying each one.
+        tasks = []
+        for t in data.get("tasks", []):
+            t.pop("verification_func", None)
+            tasks.append(BenchmarkTask(**t))
 
         return cls(
             name=data.get("name", "Custom"),
@@ -118,19 +186,11 @@ class BenchmarkSuite:
     # ── Built-in Suites ──────────────────────────────────────────────
 
     @classmethod
+    @_memoized_suite
     def builtin_basic(cls) -> "BenchmarkSuite":
         """Basic single-app tasks (15 tasks)."""
         tasks = [
-            BenchmarkTask(
-                task_id="basic_001",
-                name="Open Notepad",
-                description="Open the Notepad application.",
-                category="basic",
-                domain="notepad",
-                optimal_steps=1,
-                cleanup_commands=["taskkill /im notepad.exe /f 2>$null"],
-                verification="Notepad window is visible",
-            ),
+            _simple_open_task("basic_001", "Notepad", "notepad", "notepad.exe"),
             BenchmarkTask(
                 task_id="basic_002",
                 name="Type in Notepad",
@@ -154,15 +214,9 @@ class BenchmarkSuite:
                 ],
                 verification="File agenticos_test.txt exists on Desktop with content 'Test content'",
             ),
-            BenchmarkTask(
-                task_id="basic_004",
-                name="Open Calculator",
+            _simple_open_task(
+                "basic_004", "Calculator", "calculator", "CalculatorApp.exe",
                 description="Open the Windows Calculator application.",
-                category="basic",
-                domain="calculator",
-                optimal_steps=1,
-                cleanup_commands=["taskkill /im CalculatorApp.exe /f 2>$null"],
-                verification="Calculator window is visible",
             ),
             BenchmarkTask(
                 task_id="basic_005",
@@ -174,15 +228,10 @@ class BenchmarkSuite:
                 cleanup_commands=["taskkill /im CalculatorApp.exe /f 2>$null"],
                 verification="Calculator shows result 100",
             ),
-            BenchmarkTask(
-                task_id="basic_006",
-                name="Open File Explorer",
+            _simple_open_task(
+                "basic_006", "File Explorer", "explorer", "explorer.exe",
                 description="Open File Explorer.",
-                category="basic",
-                domain="explorer",
-                optimal_steps=1,
                 cleanup_commands=["taskkill /im explorer.exe /f 2>$null; Start-Process explorer.exe"],
-                verification="File Explorer window is visible",
             ),
             BenchmarkTask(
                 task_id="basic_007",
@@ -193,26 +242,11 @@ class BenchmarkSuite:
                 optimal_steps=2,
                 verification="File Explorer shows Documents folder",
             ),
-            BenchmarkTask(
-                task_id="basic_008",
-                name="Open Settings",
+            _simple_open_task(
+                "basic_008", "Settings", "settings", "SystemSettings.exe",
                 description="Open Windows Settings.",
-                category="basic",
-                domain="settings",
-                optimal_steps=1,
-                cleanup_commands=["taskkill /im SystemSettings.exe /f 2>$null"],
-                verification="Settings window is visible",
-            ),
-            BenchmarkTask(
-                task_id="basic_009",
-                name="Open Paint",
-                description="Open the Paint application.",
-                category="basic",
-                domain="paint",
-                optimal_steps=1,
-                cleanup_commands=["taskkill /im mspaint.exe /f 2>$null"],
-                verification="Paint window is visible",
             ),
+            _simple_open_task("basic_009", "Paint", "paint", "mspaint.exe"),
             BenchmarkTask(
                 task_id="basic_010",
                 name="Create Desktop folder",
@@ -281,6 +315,7 @@ class BenchmarkSuite:
         )
 
     @classmethod
+    @_memoized_suite
     def builtin_intermediate(cls) -> "BenchmarkSuite":
         """Intermediate multi-app tasks (10 tasks)."""
         tasks = [
@@ -397,6 +432,7 @@ class BenchmarkSuite:
         )
 
     @classmethod
+    @_memoized_suite
     def builtin_advanced(cls) -> "BenchmarkSuite":
         """Advanced complex workflow tasks (5 tasks)."""
         tasks = [
@@ -468,6 +504,7 @@ class BenchmarkSuite:
         )
 
     @classmethod
+    @_memoized_suite
     def builtin_all(cls) -> "BenchmarkSuite":
         """Combined suite with all built-in tasks (30 tasks)."""
         basic = cls.builtin_basic()
@@ -7,14 +7,53 @@ fast, precise, and requires no GPU.
 
 from __future__ import annotations
 
-import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from itertools import chain
+from typing import Callable, Optional
 
 from agenticos.utils.exceptions import GroundingError
 
+# UIA_*ControlTypeId constants from UIAutomationClient.h
+_CONTROL_TYPE_IDS: dict[str, int] = {
+    name: 50000 + offset
+    for offset, name in enumerate(
+        (
+            "Button", "Calendar", "CheckBox", "ComboBox", "Edit", "Hyperlink", "Image",
+            "ListItem", "List", "Menu", "MenuBar", "MenuItem", "ProgressBar", "RadioButton",
+            "ScrollBar", "Slider", "Spinner", "StatusBar", "Tab", "TabItem", "Text",
+            "ToolBar", "ToolTip", "Tree", "TreeItem", "Custom", "Group", "Thumb",
+            "DataGrid", "DataItem", "Document", "SplitButton", "Window", "Pane", "Header",
+            "HeaderItem", "Table", "TitleBar", "Separator", "SemanticZoom", "AppBar",
+        )
+    )
+}
+_CONTROL_TYPE_NAMES: dict[int, str] = {v: k for k, v in _CONTROL_TYPE_IDS.items()}
+
+# Interactive controls whose child count carries no meaning for the agent
+_LEAF_TYPE_IDS = frozenset(
+    _CONTROL_TYPE_IDS[name]
+    for name in (
+        "Button", "Edit", "CheckBox", "RadioButton", "Hyperlink", "Slider", "Spinner",
+        "ScrollBar",
+    )
+)
+
+# UIA_ValueValuePropertyId (ValuePattern.Value)
+_UIA_VALUE_VALUE_PROPERTY_ID = 30045
+
+# Tree-text indentation per depth, capped at 4 levels
+_INDENTS = tuple("  " * depth for depth in range(5))
+
+# Cap on elements returned by a single detect() call
+_MAX_ELEMENTS = 300
+# Top-level windows scanned concurrently
+_MAX_SCAN_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True)
 class UIElement:
     """A detected UI element from the accessibility tree.
 
@@ -28,7 +67,8 @@ class UIElement:
         is_enabled: Whether the element is enabled.
         is_visible: Whether the element is visible on screen.
         value: Current value (for text fields, etc.).
-        children_count: Number of child elements.
+        children_count: Number of child elements (always 0 for leaf controls
+            such as Button or Edit).
         depth: Depth in the UI tree.
         handle: Window handle (HWND).
         idx: Index assigned during enumeration.
@@ -114,6 +154,8 @@ class UIAGrounder:
         "DataItem",
         "ScrollBar",
     }
+    # Same set as UIA_*ControlTypeId integers, compared against cached values
+    INTERACTIVE_TYPE_IDS = frozenset(map(_CONTROL_TYPE_IDS.__getitem__, INTERACTIVE_TYPES))
 
     def __init__(
         self,
@@ -131,6 +173,12 @@ class UIAGrounder:
         self.max_depth = max_depth
         self.interactive_only = interactive_only
         self.min_size = min_size
+        self._uia_client: object = None
+        # Per-thread COM state: each scan worker builds its own cache request
+        self._local = threading.local()
+        self._watch_handler: object = None
+        self._snapshot: Optional[list[UIElement]] = None
+        self._changed = threading.Event()
 
     def detect(
         self,
@@ -153,7 +201,6 @@ class UIAGrounder:
             from pywinauto import Desktop
             from pywinauto.application import Application
 
-            start = time.perf_counter()
             elements: list[UIElement] = []
 
             if window_title:
@@ -164,7 +211,7 @@ class UIAGrounder:
                         timeout=5,
                     )
                     window = app.top_window()
-                    self._walk_tree(window.wrapper_object(), elements, depth=0)
+                    self._scan(window.wrapper_object(), elements)
                 except Exception as e:
                     raise GroundingError(
                         f"Could not connect to window '{window_title}': {e}"
@@ -173,27 +220,38 @@ class UIAGrounder:
                 try:
                     app = Application(backend="uia").connect(process=process_id)
                     window = app.top_window()
-                    self._walk_tree(window.wrapper_object(), elements, depth=0)
+                    self._scan(window.wrapper_object(), elements)
                 except Exception as e:
                     raise GroundingError(
                         f"Could not connect to process {process_id}: {e}"
                     ) from e
             else:
-                # Enumerate all top-level windows
-                desktop = Desktop(backend="uia")
-                for win in desktop.windows():
-                    try:
-                        if not win.is_visible():
-                            continue
-                        self._walk_tree(win, elements, depth=0)
-                    except Exception:
-                        continue  # Skip inaccessible windows
+                # While watching, reuse the last scan until UIA reports a change
+                if self._snapshot is not None and not self._changed.is_set():
+                    return list(self._snapshot)
+                self._changed.clear()
+
+                # Enumerate all top-level windows; each scan mostly waits on
+                # another process's UIA server, so walk them concurrently.
+                # Only window handles cross to the workers, which create
+                # their own elements in their own apartment.
+                handles = [w.handle for w in Desktop(backend="uia").windows()]
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(_MAX_SCAN_WORKERS, len(handles)))
+                ) as pool:
+                    for found in pool.map(self._scan_window, handles):
+                        elements.extend(found)
+                # Same cap a sequential scan would have hit, in window order
+                del elements[_MAX_ELEMENTS:]
 
             # Assign indices
             for i, elem in enumerate(elements):
                 elem.idx = i
 
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            if self._watch_handler is not None and not (window_title or process_id):
+                self._snapshot = elements
+                return list(elements)
+
             return elements
 
         except ImportError:
@@ -206,6 +264,69 @@ class UIAGrounder:
         except Exception as e:
             raise GroundingError(f"UIA grounding failed: {e}") from e
 
+    def watch(self) -> None:
+        """Serve desktop-wide ``detect()`` calls from a cached snapshot.
+
+        Subscribes once to UIA structure-changed, focus-changed and
+        property-changed events on the desktop root. Until one of them
+        fires, ``detect()`` without a window or process filter returns the
+        previous result instead of re-scanning every window.
+
+        Raises:
+            GroundingError: If the UIA event subscription fails.
+        """
+        if self._watch_handler is not None:
+            return
+        try:
+            from pywinauto.uia_defines import IUIA
+
+            uia = IUIA()
+            client = uia.UIA_dll
+            handler = _make_change_handler(client, self._changed.set)
+            uia.iuia.AddStructureChangedEventHandler(
+                uia.root, client.TreeScope_Subtree, None, handler
+            )
+            uia.iuia.AddFocusChangedEventHandler(None, handler)
+            uia.iuia.AddPropertyChangedEventHandler(
+                uia.root,
+                client.TreeScope_Subtree,
+                None,
+                handler,
+                [
+                    client.UIA_NamePropertyId,
+                    client.UIA_BoundingRectanglePropertyId,
+                    client.UIA_IsEnabledPropertyId,
+                    client.UIA_IsOffscreenPropertyId,
+                ],
+            )
+        except ImportError:
+            raise GroundingError(
+                "pywinauto is required for UIA grounding. "
+                "Install with: pip install pywinauto"
+            )
+        except Exception as e:
+            raise GroundingError(f"Could not subscribe to UIA events: {e}") from e
+
+        self._watch_handler = handler
+        self._snapshot = None
+
+    def unwatch(self) -> None:
+        """Unsubscribe from UIA events and drop the cached snapshot."""
+        handler = self._watch_handler
+        if handler is None:
+            return
+        self._watch_handler = None
+        self._snapshot = None
+        try:
+            from pywinauto.uia_defines import IUIA
+
+            uia = IUIA()
+            uia.iuia.RemoveStructureChangedEventHandler(uia.root, handler)
+            uia.iuia.RemoveFocusChangedEventHandler(handler)
+            uia.iuia.RemovePropertyChangedEventHandler(uia.root, handler)
+        except Exception:
+            pass  # Handlers die with the process anyway
+
     def detect_focused_window(self) -> list[UIElement]:
         """Detect elements in the currently focused/foreground window.
 
@@ -239,113 +360,316 @@ class UIAGrounder:
         if not elements:
             return "No interactive UI elements detected."
 
-        lines = [f"Detected {len(elements)} interactive UI elements:"]
-        for elem in elements:
-            indent = "  " * min(elem.depth, 4)
-            lines.append(f"{indent}{elem.description()}")
+        header = f"Detected {len(elements)} interactive UI elements:"
+        return "\n".join(
+            chain(
+                (header,),
+                (f"{_INDENTS[min(e.depth, 4)]}{e.description()}" for e in elements),
+            )
+        )
+
+    def _get_cache_request(self) -> object:
+        """Lazily build the UIA CacheRequest used to batch property reads.
+
+        Every property the grounder needs is registered once, so a single
+        ``BuildUpdatedCache`` call marshals the whole subtree instead of one
+        cross-process COM call per property per element. The request is a
+        COM object, so each thread that walks a tree builds its own.
+
+        Returns:
+            This thread's ``IUIAutomationCacheRequest``.
+        """
+        request = getattr(self._local, "cache_request", None)
+        if request is None:
+            request = self._local.cache_request = self._build_cache_request()
+        return request
+
+    def _build_cache_request(self) -> object:
+        """Create a subtree cache request and remember the UIA client."""
+        from pywinauto.uia_defines import IUIA
+
+        uia = IUIA()
+        client = uia.UIA_dll
+        request = uia.iuia.CreateCacheRequest()
+        for prop_id in (
+            client.UIA_NamePropertyId,
+            client.UIA_ControlTypePropertyId,
+            client.UIA_AutomationIdPropertyId,
+            client.UIA_ClassNamePropertyId,
+            client.UIA_IsEnabledPropertyId,
+            client.UIA_IsOffscreenPropertyId,
+            client.UIA_BoundingRectanglePropertyId,
+            client.UIA_NativeWindowHandlePropertyId,
+            client.UIA_RangeValueValuePropertyId,
+            client.UIA_RangeValueMinimumPropertyId,
+            client.UIA_RangeValueMaximumPropertyId,
+            _UIA_VALUE_VALUE_PROPERTY_ID,
+        ):
+            request.AddProperty(prop_id)
+        # Raw view, to match pywinauto's children() enumeration
+        request.TreeFilter = uia.true_condition
+        request.TreeScope = client.TreeScope_Subtree
+        # Everything is read from the cache; skip live element references
+        request.AutomationElementMode = client.AutomationElementMode_None
+
+        self._uia_client = client
+        return request
+
+    def _scan(
+        self,
+        element: object,
+        results: list[UIElement],
+        max_elements: int = _MAX_ELEMENTS,
+    ) -> None:
+        """Collect elements under one top-level window.
+
+        The subtree is walked from one cached snapshot, so every element
+        carries its real depth and ``max_depth`` bounds the walk in both
+        modes; ``interactive_only`` filters what is collected.
+
+        Args:
+            element: pywinauto wrapper of the window.
+            results: Accumulator list for found elements.
+            max_elements: Stop collecting after this many elements.
+        """
+        self._walk_tree(element, results, depth=0, max_elements=max_elements)
 
-        return "\n".join(lines)
+    def _scan_window(self, handle: int) -> list[UIElement]:
+        """Scan one visible top-level window on a worker thread.
+
+        The window wrapper and the cache request are created here, inside
+        the worker's own COM apartment, rather than borrowed from the
+        thread that enumerated the windows.
+
+        Args:
+            handle: Native handle of the window.
+
+        Returns:
+            Elements found in the window (empty if hidden or inaccessible).
+        """
+        import comtypes
+
+        comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        try:
+            found: list[UIElement] = []
+            try:
+                window = self._window_from_handle(handle)
+                if window.is_visible():  # type: ignore[attr-defined]
+                    self._scan(window, found)
+            except Exception:
+                pass  # Skip inaccessible windows
+            return found
+        finally:
+            comtypes.CoUninitialize()
+
+    @staticmethod
+    def _window_from_handle(handle: int) -> object:
+        """Wrap a native window handle in a UIA wrapper for the calling thread."""
+        from pywinauto.controls.uiawrapper import UIAWrapper
+        from pywinauto.uia_element_info import UIAElementInfo
+
+        return UIAWrapper(UIAElementInfo(handle))
 
     def _walk_tree(
         self,
         element: object,
         results: list[UIElement],
         depth: int,
-        max_elements: int = 300,
+        max_elements: int = _MAX_ELEMENTS,
     ) -> None:
-        """Recursively walk the UI automation tree.
+        """Walk the UI automation tree depth-first with an explicit stack.
+
+        The subtree under ``element`` is fetched with one ``BuildUpdatedCache``
+        call and then traversed through cached children only.
 
         Args:
-            element: pywinauto wrapper element.
+            element: pywinauto wrapper element at the root of the walk.
             results: Accumulator list for found elements.
-            depth: Current depth in the tree.
+            depth: Depth of ``element`` in the UI tree.
             max_elements: Stop collecting after this many elements.
         """
-        if depth > self.max_depth:
+        try:
+            raw = element.element_info.element  # type: ignore[attr-defined]
+            root = raw.BuildUpdatedCache(self._get_cache_request())
+        except Exception:
+            return  # Inaccessible window
+
+        stack: deque[tuple[object, int]] = deque([(root, depth)])
+
+        while stack and len(results) < max_elements:
+            node, node_depth = stack.pop()
+            if node_depth > self.max_depth:
+                continue
+
+            # Below the depth limit children are only needed for the count,
+            # which leaf controls don't report
+            if node_depth == self.max_depth and _is_leaf(node):
+                children = []
+            else:
+                children = _cached_children(node)
+
+            try:
+                self._collect(node, node_depth, len(children), results)
+            except Exception:
+                pass  # Skip inaccessible elements
+
+            # Reversed so the stack pops children in document order
+            stack.extend((child, node_depth + 1) for child in reversed(children))
+
+    def _collect(
+        self,
+        element: object,
+        depth: int,
+        children_count: int,
+        results: list[UIElement],
+    ) -> None:
+        """Append ``element`` to ``results`` if it passes the filters.
+
+        Args:
+            element: Cached ``IUIAutomationElement``.
+            depth: Depth in the UI tree.
+            children_count: Number of direct children of ``element``
+                (ignored for leaf control types, which always report 0).
+            results: Accumulator list for found elements.
+        """
+        ctid = element.CachedControlType  # type: ignore[attr-defined]
+
+        # Filter to interactive types
+        if self.interactive_only and ctid not in self.INTERACTIVE_TYPE_IDS:
             return
-        if len(results) >= max_elements:
+
+        control_type = _CONTROL_TYPE_NAMES.get(ctid, "")
+        name = element.CachedName or ""  # type: ignore[attr-defined]
+
+        # Get bounding rectangle
+        rect = element.CachedBoundingRectangle  # type: ignore[attr-defined]
+        bbox = (rect.left, rect.top, rect.right, rect.bottom)
+        w = rect.right - rect.left
+        h = rect.bottom - rect.top
+
+        # Filter out tiny/invisible elements
+        if w < self.min_size or h < self.min_size:
             return
+        center = (rect.left + w // 2, rect.top + h // 2)
+
+        class_name = element.CachedClassName or ""  # type: ignore[attr-defined]
+
+        # Try to get value
+        value = None
+        # For sliders, read the cached RangeValue for an accurate percentage
+        if control_type == "Slider":
+            value = self._slider_value(element)
+        # Fallback: ValuePattern value when it adds something beyond the name
+        if value is None:
+            cached = element.GetCachedPropertyValue(  # type: ignore[attr-defined]
+                _UIA_VALUE_VALUE_PROPERTY_ID
+            )
+            if isinstance(cached, str) and cached and cached != name:
+                value = cached
+
+        results.append(
+            UIElement(
+                name=name,
+                control_type=control_type,
+                automation_id=element.CachedAutomationId or "",  # type: ignore[attr-defined]
+                class_name=class_name,
+                bbox=bbox,
+                center=center,
+                is_enabled=bool(element.CachedIsEnabled),  # type: ignore[attr-defined]
+                is_visible=not element.CachedIsOffscreen,  # type: ignore[attr-defined]
+                value=value,
+                children_count=0 if ctid in _LEAF_TYPE_IDS else children_count,
+                depth=depth,
+                handle=element.CachedNativeWindowHandle or 0,  # type: ignore[attr-defined]
+            )
+        )
 
-        try:
-            # Get element properties
-            props = element.element_info  # type: ignore[attr-defined]
-            control_type = props.control_type or ""
-            name = props.name or ""
-
-            # Filter to interactive types
-            if self.interactive_only and control_type not in self.INTERACTIVE_TYPES:
-                pass  # Still recurse into children
-            else:
-                # Get bounding rectangle
-                try:
-                    rect = element.rectangle()  # type: ignore[attr-defined]
-                    bbox = (rect.left, rect.top, rect.right, rect.bottom)
-                    w = rect.right - rect.left
-                    h = rect.bottom - rect.top
-
-                    # Filter out tiny/invisible elements
-                    if w >= self.min_size and h >= self.min_size:
-                        center = (rect.left + w // 2, rect.top + h // 2)
-
-                        # Try to get value
-                        value = None
-                        try:
-                            # For sliders, try RangeValuePattern first for accurate percentage
-                            if control_type == "Slider":
-                                try:
-                                    rv = element.iface_range_value
-                                    cur = rv.CurrentValue
-                                    mn = rv.CurrentMinimum
-                                    mx = rv.CurrentMaximum
-                                    if mx > mn:
-                                        pct = int((cur - mn) / (mx - mn) * 100)
-                                        value = f"{pct}%"
-                                    else:
-                                        value = str(int(cur))
-                                except Exception:
-                                    pass
-                            # Fallback: window_text
-                            if value is None:
-                                value = element.window_text()
-                                if value == name:
-                                    value = None
-                        except Exception:
-                            pass
-
-                        # Get child count
-                        try:
-                            children = element.children()  # type: ignore[attr-defined]
-                            children_count = len(children)
-                        except Exception:
-                            children_count = 0
-
-                        ui_elem = UIElement(
-                            name=name,
-                            control_type=control_type,
-                            automation_id=getattr(props, "automation_id", "") or "",
-                            class_name=getattr(props, "class_name", "") or "",
-                            bbox=bbox,
-                            center=center,
-                            is_enabled=getattr(props, "enabled", True),
-                            is_visible=getattr(props, "visible", True),
-                            value=value,
-                            children_count=children_count,
-                            depth=depth,
-                            handle=getattr(props, "handle", 0) or 0,
-                        )
-                        results.append(ui_elem)
-                except Exception:
-                    pass
-
-            # Recurse into children
-            if len(results) < max_elements:
-                try:
-                    for child in element.children():  # type: ignore[attr-defined]
-                        if len(results) >= max_elements:
-                            break
-                        self._walk_tree(child, results, depth + 1, max_elements)
-                except Exception:
-                    pass
+    def _slider_value(self, element: object) -> Optional[str]:
+        """Format a slider's cached RangeValue as a percentage.
+
+        Args:
+            element: Cached ``IUIAutomationElement`` of a Slider.
 
+        Returns:
+            String like '75%', or None if the pattern is unavailable.
+        """
+        client = self._uia_client
+        try:
+            get = element.GetCachedPropertyValue  # type: ignore[attr-defined]
+            cur = float(get(client.UIA_RangeValueValuePropertyId))  # type: ignore[attr-defined]
+            mn = float(get(client.UIA_RangeValueMinimumPropertyId))  # type: ignore[attr-defined]
+            mx = float(get(client.UIA_RangeValueMaximumPropertyId))  # type: ignore[attr-defined]
         except Exception:
-            pass  # Skip inaccessible elements
+            return None
+        if mx > mn:
+            return f"{int((cur - mn) / (mx - mn) * 100)}%"
+        return str(int(cur))
+
+
+def _cached_children(element: object) -> list:
+    """Return the cached children of a UIA element as a list.
+
+    Args:
+        element: ``IUIAutomationElement`` built with a subtree CacheRequest.
+
+    Returns:
+        Child elements in document order (empty if none).
+    """
+    try:
+        array = element.GetCachedChildren()  # type: ignore[attr-defined]
+    except Exception:
+        return []
+    if not array:
+        return []
+    return [array.GetElement(i) for i in range(array.Length)]
+
+
+def _is_leaf(element: object) -> bool:
+    """Whether a cached element is a control type whose children are not counted.
+
+    Args:
+        element: Cached ``IUIAutomationElement``.
+
+    Returns:
+        True for leaf control types (Button, Edit, Slider, ...).
+    """
+    try:
+        return element.CachedControlType in _LEAF_TYPE_IDS  # type: ignore[attr-defined]
+    except Exception:
+        return False
+
+
+def _make_change_handler(client: object, on_change: Callable[[], None]) -> object:
+    """Create a COM object that calls ``on_change`` for any UIA change event.
+
+    Args:
+        client: The ``comtypes.gen.UIAutomationClient`` module.
+        on_change: Callback invoked (on a UIA worker thread) per event.
+
+    Returns:
+        A handler implementing the structure, focus and property-changed
+        event interfaces.
+    """
+    import comtypes
+
+    class _ChangeHandler(comtypes.COMObject):  # type: ignore[misc]
+        _com_interfaces_ = [
+            client.IUIAutomationStructureChangedEventHandler,  # type: ignore[attr-defined]
+            client.IUIAutomationFocusChangedEventHandler,  # type: ignore[attr-defined]
+            client.IUIAutomationPropertyChangedEventHandler,  # type: ignore[attr-defined]
+        ]
+
+        def HandleStructureChangedEvent(  # noqa: N802
+            self, sender: object, change_type: int, runtime_id: object
+        ) -> None:
+            on_change()
+
+        def HandleFocusChangedEvent(self, sender: object) -> None:  # noqa: N802
+            on_change()
+
+        def HandlePropertyChangedEvent(  # noqa: N802
+            self, sender: object, property_id: int, new_value: object
+        ) -> None:
+            on_change()
+
+    return _ChangeHandler()
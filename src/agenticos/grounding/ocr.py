@@ -6,15 +6,106 @@ Serves as a lightweight middle layer between UIA and full VLM grounding.
 
 from __future__ import annotations
 
-import time
+import os
+import threading
+import weakref
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
+from PIL import Image
 
 from agenticos.grounding.accessibility import UIElement
 from agenticos.observation.screenshot import Screenshot
 from agenticos.utils.exceptions import GroundingError
 
+# One RapidOCR instance (three ONNX sessions) per process and precision
+_ENGINES: dict[bool, object] = {}
+_ENGINE_LOCK = threading.Lock()
+
+# Where INT8 copies of the bundled RapidOCR models are written
+_INT8_MODEL_DIR = Path.home() / ".cache" / "agenticos" / "rapidocr_int8"
+
+
+def _shared_engine(quantized: bool = False) -> object:
+    """Create the process-wide RapidOCR engine on first use.
+
+    Args:
+        quantized: Use INT8-quantized detection/recognition models.
+
+    Returns:
+        The shared RapidOCR instance.
+
+    Raises:
+        GroundingError: If rapidocr-onnxruntime is not installed.
+    """
+    engine = _ENGINES.get(quantized)
+    if engine is None:
+        with _ENGINE_LOCK:
+            engine = _ENGINES.get(quantized)
+            if engine is None:
+                try:
+                    from rapidocr_onnxruntime import RapidOCR
+                except ImportError:
+                    raise GroundingError(
+                        "rapidocr-onnxruntime is required for OCR grounding. "
+                        "Install with: pip install rapidocr-onnxruntime"
+                    )
+                model_paths = _int8_model_paths() if quantized else {}
+                # Half the cores per session leaves room for concurrent groundings
+                engine = RapidOCR(
+                    det_use_cuda=False,
+                    rec_use_cuda=False,
+                    intra_op_num_threads=max(1, (os.cpu_count() or 2) // 2),
+                    **model_paths,
+                )
+                _ENGINES[quantized] = engine
+    return engine
+
+
+def _int8_model_paths() -> dict[str, str]:
+    """Quantize RapidOCR's detection and recognition models to INT8 once.
+
+    The quantized copies are cached under ``~/.cache/agenticos`` so the
+    (slow) quantization only runs on first use.
+
+    Returns:
+        ``det_model_path`` / ``rec_model_path`` keyword arguments for RapidOCR.
+
+    Raises:
+        GroundingError: If onnxruntime's quantization tools or the bundled
+            models are unavailable.
+    """
+    try:
+        import rapidocr_onnxruntime
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        raise GroundingError(
+            "onnxruntime quantization tools are required for INT8 OCR. "
+            "Install with: pip install onnx onnxruntime"
+        )
+
+    models_dir = Path(rapidocr_onnxruntime.__file__).parent / "models"
+    paths: dict[str, str] = {}
+    for kind in ("det", "rec"):
+        candidates = sorted(models_dir.glob(f"*_{kind}_*.onnx"))
+        if not candidates:
+            raise GroundingError(f"No RapidOCR {kind} model found in {models_dir}")
+        src = candidates[-1]
+        dst = _INT8_MODEL_DIR / f"{src.stem}_int8.onnx"
+        if not dst.exists():
+            _INT8_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = dst.with_suffix(".tmp")
+            quantize_dynamic(
+                str(src),
+                str(tmp),
+                weight_type=QuantType.QInt8,
+                op_types_to_quantize=["MatMul", "Conv"],
+            )
+            tmp.replace(dst)
+        paths[f"{kind}_model_path"] = str(dst)
+    return paths
+
 
 class OCRGrounder:
     """OCR-based text element detection.
@@ -29,26 +120,35 @@ class OCRGrounder:
         ...     print(f"Text: {elem.name} at {elem.center}")
     """
 
-    def __init__(self, confidence_threshold: float = 0.5) -> None:
+    def __init__(
+        self,
+        confidence_threshold: float = 0.5,
+        quantized: bool = False,
+        max_dimension: Optional[int] = 1280,
+    ) -> None:
         """Initialize OCR grounder.
 
         Args:
             confidence_threshold: Minimum confidence for detected text (0-1).
+            quantized: Run INT8-quantized OCR models (faster on CPUs with
+                VNNI, at a small accuracy cost).
+            max_dimension: Downscale screenshots so their longest edge is at
+                most this many pixels before OCR (None = full resolution).
         """
         self.confidence_threshold = confidence_threshold
+        self.quantized = quantized
+        self.max_dimension = max_dimension
         self._ocr_engine: object = None
+        # Weak refs to the last screenshot OCR'd for lookups and to its image,
+        # with the elements and (N, 2) centers found in it
+        self._indexed: Optional[
+            tuple[weakref.ref, weakref.ref, list[UIElement], np.ndarray]
+        ] = None
 
     def _get_engine(self) -> object:
-        """Lazy-initialize OCR engine."""
+        """Lazy-initialize OCR engine (shared by all grounders)."""
         if self._ocr_engine is None:
-            try:
-                from rapidocr_onnxruntime import RapidOCR
-                self._ocr_engine = RapidOCR()
-            except ImportError:
-                raise GroundingError(
-                    "rapidocr-onnxruntime is required for OCR grounding. "
-                    "Install with: pip install rapidocr-onnxruntime"
-                )
+            self._ocr_engine = _shared_engine(self.quantized)
         return self._ocr_engine
 
     def detect(self, screenshot: Screenshot) -> list[UIElement]:
@@ -65,38 +165,40 @@ class OCRGrounder:
         """
         try:
             engine = self._get_engine()
-            img_array = screenshot.to_numpy()
+            img_array, scale = self._prepare_image(screenshot)
 
-            start = time.perf_counter()
-            result, elapse = engine(img_array)  # type: ignore
-            elapsed_ms = (time.perf_counter() - start) * 1000
+            result, _ = engine(img_array)  # type: ignore
 
-            if result is None:
+            if not result:
                 return []
 
-            elements: list[UIElement] = []
-            for i, (bbox_points, text, confidence) in enumerate(result):
-                if confidence < self.confidence_threshold:
-                    continue
-
-                # bbox_points is [[x1,y1],[x2,y2],[x3,y3],[x4,y4]] (polygon)
-                xs = [p[0] for p in bbox_points]
-                ys = [p[1] for p in bbox_points]
-                left = int(min(xs))
-                top = int(min(ys))
-                right = int(max(xs))
-                bottom = int(max(ys))
-
-                w = right - left
-                h = bottom - top
-                center = (left + w // 2, top + h // 2)
+            # Drop sub-threshold rows before touching the polygons
+            confidences = np.fromiter(
+                (r[2] for r in result), dtype=np.float32, count=len(result)
+            )
+            keep = np.flatnonzero(confidences >= self.confidence_threshold)
+            if keep.size == 0:
+                return []
+
+            # bbox polygons are [[x1,y1],[x2,y2],[x3,y3],[x4,y4]]; reduce all at once
+            polys = np.asarray([result[i][0] for i in keep], dtype=np.float32)
+            if scale is not None:
+                polys /= scale  # back to screenshot coordinates
+            mins = polys.min(axis=1).astype(np.int32)
+            maxs = polys.max(axis=1).astype(np.int32)
+            centers = (mins + maxs) // 2
 
+            elements: list[UIElement] = []
+            for i, (left, top), (right, bottom), center in zip(
+                keep.tolist(), mins.tolist(), maxs.tolist(), centers.tolist()
+            ):
+                text = result[i][1]
                 elements.append(
                     UIElement(
                         name=text,
                         control_type="Text",
                         bbox=(left, top, right, bottom),
-                        center=center,
+                        center=(center[0], center[1]),
                         idx=i,
                         value=text,
                         depth=0,
@@ -110,6 +212,32 @@ class OCRGrounder:
         except Exception as e:
             raise GroundingError(f"OCR grounding failed: {e}") from e
 
+    def _prepare_image(
+        self, screenshot: Screenshot
+    ) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """Get the OCR input array, downscaled to ``max_dimension`` if larger.
+
+        OCR cost grows with pixel count, and text stays legible at ~1280px.
+
+        Args:
+            screenshot: Screenshot to analyze.
+
+        Returns:
+            Tuple of (RGB array, per-axis (sx, sy) scale or None if unscaled).
+        """
+        width, height = screenshot.width, screenshot.height
+        longest = max(width, height)
+        if not self.max_dimension or longest <= self.max_dimension:
+            return screenshot.view_numpy(), None
+
+        ratio = self.max_dimension / longest
+        new_size = (max(1, round(width * ratio)), max(1, round(height * ratio)))
+        small = screenshot.image.resize(new_size, Image.BOX)
+        scale = np.array(
+            [new_size[0] / width, new_size[1] / height], dtype=np.float32
+        )
+        return np.asarray(small), scale
+
     def detect_text_at(
         self, screenshot: Screenshot, x: int, y: int, radius: int = 50
     ) -> Optional[str]:
@@ -124,20 +252,46 @@ class OCRGrounder:
         Returns:
             Detected text near the coordinate, or None.
         """
-        elements = self.detect(screenshot)
-        best_match: Optional[UIElement] = None
-        best_distance = float("inf")
+        elements, centers = self._detect_indexed(screenshot)
+        if not elements:
+            return None
+
+        # Nearest center by squared distance; no sqrt needed to compare
+        d2 = ((centers - (x, y)) ** 2).sum(axis=1)
+        best = int(d2.argmin())
+        if d2[best] < radius * radius:
+            return elements[best].name
+        return None
+
+    def _detect_indexed(
+        self, screenshot: Screenshot
+    ) -> tuple[list[UIElement], np.ndarray]:
+        """Run OCR once per screenshot image and keep the result for repeat lookups.
 
-        for elem in elements:
-            dx = elem.center[0] - x
-            dy = elem.center[1] - y
-            distance = (dx * dx + dy * dy) ** 0.5
+        The cache is dropped when the screenshot is garbage-collected or its
+        ``image`` is replaced, and never keeps either alive.
 
-            if distance < radius and distance < best_distance:
-                best_distance = distance
-                best_match = elem
+        Args:
+            screenshot: Screenshot to analyze.
 
-        return best_match.name if best_match else None
+        Returns:
+            Tuple of (elements, centers) where centers is an (N, 2) int64 array.
+        """
+        indexed = self._indexed
+        if (
+            indexed is None
+            or indexed[0]() is not screenshot
+            or indexed[1]() is not screenshot.image
+        ):
+            elements = self.detect(screenshot)
+            centers = np.array([e.center for e in elements], dtype=np.int64).reshape(-1, 2)
+            indexed = self._indexed = (
+                weakref.ref(screenshot),
+                weakref.ref(screenshot.image),
+                elements,
+                centers,
+            )
+        return indexed[2], indexed[3]
 
     def get_all_text(self, screenshot: Screenshot) -> str:
         """Extract all visible text from the screenshot.
@@ -148,7 +302,7 @@ class OCRGrounder:
         Returns:
             All detected text concatenated with newlines.
         """
-        elements = self.detect(screenshot)
-        # Sort by vertical position then horizontal
-        elements.sort(key=lambda e: (e.center[1] // 20, e.center[0]))
-        return "\n".join(e.name for e in elements if e.name)
+        elements, centers = self._detect_indexed(screenshot)
+        # Sort by 20px text row, then horizontal position (last key is primary)
+        order = np.lexsort((centers[:, 0], centers[:, 1] // 20))
+        return "\n".join(elements[i].name for i in order.tolist() if elements[i].name)
@@ -7,13 +7,62 @@ as the fallback in the hybrid grounding pipeline.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Optional
 
+import numpy as np
+
 from agenticos.grounding.accessibility import UIElement
 from agenticos.observation.screenshot import Screenshot
 from agenticos.utils.exceptions import GroundingError
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
+# ```json ... ``` fencing around the model's answer
+_CODE_FENCE = re.compile(r"^```[a-zA-Z]*\s*\n(.*?)\n?```$", re.S)
+# Outermost JSON array, ignoring any prose around it
+_JSON_ARRAY = re.compile(r"\[.*\]", re.S)
+
+# Default bbox for elements the VLM returned without one
+_ZERO_BBOX = (0, 0, 0, 0)
+
+# Parsed VLM responses kept per VisionGrounder
+_PARSE_CACHE_SIZE = 32
+
+# Event loop shared by all detect_sync() callers, started on first use
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, starting its daemon thread if needed.
+
+    Returns:
+        A running event loop owned by a background thread.
+    """
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="agenticos-vision-loop", daemon=True
+                ).start()
+                _LOOP = loop
+    return _LOOP
+
+
 # System prompt for UI element detection
 GROUNDING_SYSTEM_PROMPT = """You are a UI element detector. Given a screenshot of a desktop application,
 identify all interactive UI elements (buttons, text fields, menus, links, checkboxes, etc.).
@@ -50,6 +99,8 @@ class VisionGrounder:
         model: str = "claude-sonnet-4-20250514",
         api_key: Optional[str] = None,
         max_tokens: int = 4096,
+        tile_size: Optional[int] = None,
+        tile_overlap: int = 128,
     ) -> None:
         """Initialize vision grounder.
 
@@ -57,10 +108,18 @@ class VisionGrounder:
             model: VLM model identifier (litellm format).
             api_key: API key (uses env var if not provided).
             max_tokens: Maximum response tokens.
+            tile_size: If set, screenshots larger than this are split into
+                overlapping tiles that are sent to the VLM concurrently.
+                Costs one request per tile.
+            tile_overlap: Pixel overlap between neighbouring tiles.
         """
         self.model = model
         self.api_key = api_key
         self.max_tokens = max_tokens
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        # (content digest, width, height) -> parsed elements, oldest first
+        self._parse_cache: OrderedDict[tuple[bytes, int, int], list[UIElement]] = OrderedDict()
 
     async def detect(self, screenshot: Screenshot) -> list[UIElement]:
         """Detect UI elements in a screenshot using VLM.
@@ -75,34 +134,9 @@ class VisionGrounder:
             GroundingError: If VLM call fails or returns invalid data.
         """
         try:
-            import litellm
-
-            base64_img = screenshot.to_base64(format="PNG", max_dimension=1568)
-
-            response = await litellm.acompletion(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": GROUNDING_SYSTEM_PROMPT},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{base64_img}"
-                                },
-                            },
-                        ],
-                    }
-                ],
-                max_tokens=self.max_tokens,
-                temperature=0.0,
-                api_key=self.api_key,
-            )
-
-            # Parse response
-            content = response.choices[0].message.content
-            return self._parse_response(content, screenshot)
+            if self.tile_size and max(screenshot.width, screenshot.height) > self.tile_size:
+                return await self._detect_tiled(screenshot)
+            return await self._detect_one(screenshot)
 
         except ImportError:
             raise GroundingError(
@@ -114,34 +148,120 @@ class VisionGrounder:
         except Exception as e:
             raise GroundingError(f"Vision grounding failed: {e}") from e
 
+    async def _detect_one(self, screenshot: Screenshot) -> list[UIElement]:
+        """Send one image to the VLM and parse its answer.
+
+        Args:
+            screenshot: Screenshot (or tile) to analyze.
+
+        Returns:
+            Detected elements in ``screenshot`` coordinates.
+        """
+        import litellm
+
+        base64_img = screenshot.to_base64(format="PNG", max_dimension=1568)
+
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": GROUNDING_SYSTEM_PROMPT},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:image/png;base64,{base64_img}"
+                            },
+                        },
+                    ],
+                }
+            ],
+            max_tokens=self.max_tokens,
+            temperature=0.0,
+            api_key=self.api_key,
+        )
+
+        # Parse response
+        content = response.choices[0].message.content
+        return self._parse_response(content, screenshot)
+
+    async def _detect_tiled(self, screenshot: Screenshot) -> list[UIElement]:
+        """Ground overlapping tiles concurrently and merge the results.
+
+        Args:
+            screenshot: Screenshot larger than ``tile_size``.
+
+        Returns:
+            De-duplicated elements in full-screenshot coordinates.
+        """
+        tiles = _split_into_tiles(screenshot, self.tile_size or 0, self.tile_overlap)
+        per_tile = await asyncio.gather(*(self._detect_one(tile) for tile, _ in tiles))
+
+        elements: list[UIElement] = []
+        for (_, (ox, oy)), found in zip(tiles, per_tile):
+            for elem in found:
+                left, top, right, bottom = elem.bbox
+                elem.bbox = (left + ox, top + oy, right + ox, bottom + oy)
+                elem.center = (elem.center[0] + ox, elem.center[1] + oy)
+                elements.append(elem)
+
+        elements = _suppress_duplicates(elements)
+        for i, elem in enumerate(elements):
+            elem.idx = i
+        return elements
+
     def detect_sync(self, screenshot: Screenshot) -> list[UIElement]:
         """Synchronous version of detect.
 
+        Runs on a persistent background event loop, so litellm's HTTP
+        connections stay alive between calls instead of being torn down
+        with a fresh loop each time.
+
         Args:
             screenshot: Screenshot to analyze.
 
         Returns:
             List of detected UIElement objects.
         """
-        import asyncio
-
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    future = pool.submit(asyncio.run, self.detect(screenshot))
-                    return future.result()
-            else:
-                return loop.run_until_complete(self.detect(screenshot))
-        except RuntimeError:
-            return asyncio.run(self.detect(screenshot))
+        future = asyncio.run_coroutine_threadsafe(self.detect(screenshot), _background_loop())
+        return future.result()
 
     def _parse_response(
         self, content: str, screenshot: Screenshot
     ) -> list[UIElement]:
         """Parse VLM response into UIElement objects.
 
+        Args:
+            content: Raw VLM response text.
+            screenshot: Original screenshot for coordinate validation.
+
+        Returns:
+            List of parsed UIElement objects.
+        """
+        # Static UIs produce identical answers; skip re-parsing them
+        key = (
+            hashlib.blake2b(content.encode(), digest_size=16).digest(),
+            screenshot.width,
+            screenshot.height,
+        )
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            return [replace(e) for e in cached]
+
+        elements = self._parse_content(content, screenshot)
+        self._parse_cache[key] = elements
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        # Callers may mutate the elements (e.g. tile offsets); keep the cache pristine
+        return [replace(e) for e in elements]
+
+    def _parse_content(
+        self, content: str, screenshot: Screenshot
+    ) -> list[UIElement]:
+        """Decode a VLM response and build UIElements from it.
+
         Args:
             content: Raw VLM response text.
             screenshot: Original screenshot for coordinate validation.
@@ -151,49 +271,224 @@ class VisionGrounder:
         """
         # Try to extract JSON from response
         content = content.strip()
-        if content.startswith("```"):
-            # Strip markdown code block
-            lines = content.split("\n")
-            content = "\n".join(lines[1:-1])
+        fenced = _CODE_FENCE.match(content)
+        if fenced:
+            content = fenced.group(1)
+        array = _JSON_ARRAY.search(content)
 
-        elements_data = json.loads(content)
+        try:
+            elements_data = _json_loads(array.group(0) if array else content)
+        except json.JSONDecodeError:
+            # Likely cut off at max_tokens: keep every element that completed
+            elements_data = _salvage_objects(content)
+            if not elements_data:
+                raise
         if not isinstance(elements_data, list):
             raise GroundingError("VLM response is not a JSON array")
 
+        rows, kept = _stack_bboxes(elements_data)
+        if not kept:
+            return []
+
+        # Validate coordinates are within screen bounds, all elements at once
+        w, h = screenshot.width, screenshot.height
+        np.clip(rows, 0, np.array([w, h, w, h], dtype=np.int64), out=rows)
+        centers = rows[:, :2] + (rows[:, 2:] - rows[:, :2]) // 2
+
         elements: list[UIElement] = []
-        for i, elem_data in enumerate(elements_data):
-            try:
-                bbox_raw = elem_data.get("bbox", [0, 0, 0, 0])
-                bbox = (
-                    int(bbox_raw[0]),
-                    int(bbox_raw[1]),
-                    int(bbox_raw[2]),
-                    int(bbox_raw[3]),
+        for i, bbox, center in zip(kept, rows.tolist(), centers.tolist()):
+            elem_data = elements_data[i]
+            elements.append(
+                UIElement(
+                    name=str(elem_data.get("name", "")),
+                    control_type=str(elem_data.get("control_type", "Unknown")),
+                    bbox=(bbox[0], bbox[1], bbox[2], bbox[3]),
+                    center=(center[0], center[1]),
+                    idx=i,
+                    depth=0,
                 )
+            )
 
-                # Validate coordinates are within screen bounds
-                bbox = (
-                    max(0, min(bbox[0], screenshot.width)),
-                    max(0, min(bbox[1], screenshot.height)),
-                    max(0, min(bbox[2], screenshot.width)),
-                    max(0, min(bbox[3], screenshot.height)),
-                )
+        return elements
+
+
+def _stack_bboxes(elements_data: list) -> tuple[np.ndarray, list[int]]:
+    """Collect every element's bbox into one (N, 4) int64 array.
+
+    Well-formed responses convert in a single NumPy call; if any bbox is
+    short or non-numeric, falls back to per-element conversion and skips
+    the malformed ones.
 
-                w = bbox[2] - bbox[0]
-                h = bbox[3] - bbox[1]
-                center = (bbox[0] + w // 2, bbox[1] + h // 2)
-
-                elements.append(
-                    UIElement(
-                        name=str(elem_data.get("name", "")),
-                        control_type=str(elem_data.get("control_type", "Unknown")),
-                        bbox=bbox,
-                        center=center,
-                        idx=i,
-                        depth=0,
-                    )
+    Args:
+        elements_data: Decoded JSON array from the VLM.
+
+    Returns:
+        Tuple of (bbox array, indices into ``elements_data`` of its rows).
+    """
+    try:
+        rows = np.array(
+            [e.get("bbox", _ZERO_BBOX)[:4] for e in elements_data], dtype=np.float64
+        )
+        if rows.ndim == 2 and rows.shape[1] == 4:
+            return rows.astype(np.int64), list(range(len(elements_data)))
+    except (KeyError, IndexError, ValueError, TypeError):
+        pass
+
+    kept: list[int] = []
+    valid: list[list[int]] = []
+    for i, elem_data in enumerate(elements_data):
+        try:
+            bbox_raw = elem_data.get("bbox", _ZERO_BBOX)
+            valid.append([int(bbox_raw[0]), int(bbox_raw[1]), int(bbox_raw[2]), int(bbox_raw[3])])
+            kept.append(i)
+        except (KeyError, IndexError, ValueError):
+            continue  # Skip malformed elements
+    return np.array(valid, dtype=np.int64).reshape(-1, 4), kept
+
+
+def _tile_origins(length: int, tile: int, overlap: int) -> list[int]:
+    """Start offsets of tiles covering ``length`` pixels along one axis.
+
+    Args:
+        length: Image size along the axis.
+        tile: Tile size.
+        overlap: Overlap between consecutive tiles.
+
+    Returns:
+        Offsets; the last tile is aligned to the image edge.
+    """
+    if length <= tile:
+        return [0]
+    step = max(1, tile - overlap)
+    origins = list(range(0, length - tile, step))
+    origins.append(length - tile)
+    return origins
+
+
+def _split_into_tiles(
+    screenshot: Screenshot, tile: int, overlap: int
+) -> list[tuple[Screenshot, tuple[int, int]]]:
+    """Crop a screenshot into overlapping tiles.
+
+    Args:
+        screenshot: Screenshot to split.
+        tile: Tile edge length in pixels.
+        overlap: Overlap between neighbouring tiles in pixels.
+
+    Returns:
+        List of (tile screenshot, (x, y) origin in the full screenshot).
+    """
+    tiles = []
+    for oy in _tile_origins(screenshot.height, tile, overlap):
+        for ox in _tile_origins(screenshot.width, tile, overlap):
+            right = min(ox + tile, screenshot.width)
+            bottom = min(oy + tile, screenshot.height)
+            tiles.append(
+                (
+                    Screenshot(
+                        image=screenshot.image.crop((ox, oy, right, bottom)),
+                        width=right - ox,
+                        height=bottom - oy,
+                        timestamp=screenshot.timestamp,
+                        monitor_index=screenshot.monitor_index,
+                        capture_time_ms=0.0,
+                    ),
+                    (ox, oy),
                 )
-            except (KeyError, IndexError, ValueError):
-                continue  # Skip malformed elements
+            )
+    return tiles
+
+
+def _suppress_duplicates(
+    elements: list[UIElement], iou_threshold: float = 0.5
+) -> list[UIElement]:
+    """Drop elements seen in more than one tile (non-maximum suppression).
+
+    Larger boxes win, since an element cut by a tile edge is reported
+    smaller in that tile.
 
+    Args:
+        elements: Elements from all tiles, in full-screenshot coordinates.
+        iou_threshold: Overlap above which two boxes are the same element.
+
+    Returns:
+        Surviving elements in their original order.
+    """
+    if len(elements) < 2:
         return elements
+
+    boxes = np.array([e.bbox for e in elements], dtype=np.float64)
+    areas = np.clip(boxes[:, 2] - boxes[:, 0], 0, None) * np.clip(
+        boxes[:, 3] - boxes[:, 1], 0, None
+    )
+    order = np.argsort(-areas, kind="stable")
+
+    keep: list[int] = []
+    while order.size:
+        best, rest = order[0], order[1:]
+        keep.append(int(best))
+        iw = np.clip(
+            np.minimum(boxes[best, 2], boxes[rest, 2]) - np.maximum(boxes[best, 0], boxes[rest, 0]),
+            0,
+            None,
+        )
+        ih = np.clip(
+            np.minimum(boxes[best, 3], boxes[rest, 3]) - np.maximum(boxes[best, 1], boxes[rest, 1]),
+            0,
+            None,
+        )
+        inter = iw * ih
+        union = areas[best] + areas[rest] - inter
+        iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+        order = rest[iou <= iou_threshold]
+
+    keep.sort()
+    return [elements[i] for i in keep]
+
+
+def _salvage_objects(content: str) -> list[dict]:
+    """Recover the complete objects from a truncated JSON array of objects.
+
+    Scans from the first ``[`` tracking brace depth (and skipping braces
+    inside strings); each top-level ``{...}`` that closes is decoded on
+    its own. Anything after the last complete object is dropped.
+
+    Args:
+        content: Response text containing a possibly truncated JSON array.
+
+    Returns:
+        The decodable objects, in order (empty if none).
+    """
+    start = content.find("[")
+    if start < 0:
+        return []
+
+    objects: list[dict] = []
+    depth = 0
+    obj_start = -1
+    in_string = escaped = False
+    for pos in range(start + 1, len(content)):
+        char = content[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                obj_start = pos
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                try:
+                    obj = _json_loads(content[obj_start : pos + 1])
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(obj, dict):
+                    objects.append(obj)
+    return objects
@@ -7,17 +7,98 @@ host (Claude Desktop, VS Code, etc.) to control the Windows desktop.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import base64
+import functools
+import itertools
 import json
-from typing import Any, Optional
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Literal, Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from agenticos.actions.compositor import Action, ActionCompositor
+from agenticos.actions.compositor import Action, ActionCompositor, ActionResult
 from agenticos.actions.shell import ShellExecutor
 from agenticos.actions.window import WindowManager
 from agenticos.grounding.accessibility import UIAGrounder
-from agenticos.observation.screenshot import ScreenCapture
+from agenticos.grounding.ocr import OCRGrounder
+from agenticos.observation.screenshot import ScreenCapture, Screenshot
+from agenticos.utils.exceptions import ActionError, PartialInputError
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode("utf-8")
+
+except ImportError:  # optional speedup
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+# Raw captures kept for take_screenshot(return_mode="handle"), shared-memory
+# segments kept alive for return_mode="shm", and BMP files reused in turn
+# for return_mode="path"
+_MAX_HANDLES = 8
+
+# return_mode="diff": tile edge and how many diffs between full frames
+_DIFF_TILE = 64
+_DIFF_REFRESH = 30
+
+# Action factory and description label: clicks=2 double-clicks with any button,
+# otherwise button="right" right-clicks; anything else is a left click
+_CLICK_DISPATCH = {
+    2: (Action.double_click, "Double-click"),
+    "right": (Action.right_click, "Right-click"),
+}
+_LEFT_CLICK = (Action.click, "Click")
+
+# Printable text up to this length is typed with one SendInput call
+_FAST_TYPE_MAX = 256
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_hotkey(keys: str) -> tuple[tuple[str, ...], str]:
+    """Parse a comma-separated hotkey string once per distinct value.
+
+    Args:
+        keys: Comma-separated key names (e.g., 'ctrl,s').
+
+    Returns:
+        Tuple of (normalized key names, 'ctrl+s'-style label).
+    """
+    key_list = tuple(k.strip().lower() for k in keys.split(","))
+    return key_list, "+".join(key_list)
+
+
+def _click_action(button: str, clicks: int) -> tuple[Any, str]:
+    """Pick the click action factory and label for the click tool's arguments."""
+    return _CLICK_DISPATCH.get(2 if clicks == 2 else button, _LEFT_CLICK)
+
+
+def _com_call(func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Call a UIA-backed function on a worker thread with COM initialized.
+
+    pywinauto's UIA backend needs COM on the calling thread, which
+    asyncio.to_thread's executor threads do not have by default.
+    """
+    import comtypes
+
+    comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        comtypes.CoUninitialize()
 
 
 def create_mcp_server() -> FastMCP:
@@ -31,36 +112,198 @@ def create_mcp_server() -> FastMCP:
     )
 
     # Shared instances
-    screen = ScreenCapture()
     grounder = UIAGrounder()
+    ocr = OCRGrounder()  # engine loads on first get_screen_text call
     compositor = ActionCompositor()
     shell = ShellExecutor()
     window_mgr = WindowManager()
+    captures: OrderedDict[str, Screenshot] = OrderedDict()
+    segments: OrderedDict[str, shared_memory.SharedMemory] = OrderedDict()
+    # segments is touched from to_thread workers as well as the event loop
+    segments_lock = threading.Lock()
+    # monitor -> (tile digests of the last frame sent, diffs since full frame)
+    tile_state: dict[int, tuple[dict[tuple[int, int], bytes], int]] = {}
+    # return_mode="path" files, removed when the process exits
+    shot_dir = Path(tempfile.mkdtemp(prefix="agenticos_"))
+    atexit.register(shutil.rmtree, shot_dir, ignore_errors=True)
+    shot_slots = itertools.count()
+
+    # mss keeps its GDI handles per thread, so the shared captures are
+    # created and grabbed from on this one thread only
+    capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+
+    @functools.lru_cache(maxsize=8)
+    def get_capture(monitor: int = 1) -> ScreenCapture:
+        """Return the shared ScreenCapture for a monitor, creating it once."""
+        return ScreenCapture(monitor=monitor)
+
+    async def grab(monitor: int = 1) -> Screenshot:
+        """Capture a monitor on the dedicated capture thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(capture_pool, lambda: get_capture(monitor).grab())
+
+    # pyautogui and window focus are not safe to drive from two threads at once
+    input_lock = asyncio.Lock()
+
+    async def execute(action: Action) -> ActionResult:
+        """Run an action on a worker thread, one input action at a time."""
+        async with input_lock:
+            return await asyncio.to_thread(compositor.execute, action)
+
+    def release_segment(name: str) -> bool:
+        """Close and unlink one shared-memory screenshot segment."""
+        with segments_lock:
+            segment = segments.pop(name, None)
+        if segment is None:
+            return False
+        segment.close()
+        segment.unlink()
+        return True
+
+    def share_screenshot(screenshot: Screenshot, format: str, max_dimension: int) -> str:
+        """Copy the encoded image into shared memory and return its address."""
+        data = screenshot.to_memoryview(format=format, max_dimension=max_dimension)
+        segment = shared_memory.SharedMemory(create=True, size=len(data))
+        segment.buf[: len(data)] = data
+        with segments_lock:
+            segments[segment.name] = segment
+            evicted = [
+                segments.popitem(last=False)[1]
+                for _ in range(len(segments) - _MAX_HANDLES)
+            ]
+        for old in evicted:
+            old.close()
+            old.unlink()
+        return f"shm://{segment.name}:{len(data)}"
+
+    def save_screenshot(screenshot: Screenshot) -> Path:
+        """Write the capture as a BMP into the next file of the path ring."""
+        path = shot_dir / f"screenshot_{next(shot_slots) % _MAX_HANDLES}.bmp"
+        partial = path.with_suffix(".tmp")
+        screenshot.image.save(partial, format="BMP")
+        # Swapped in whole so a client never reads a half-written file
+        os.replace(partial, path)
+        return path
+
+    def diff_screenshot(screenshot: Screenshot, format: str) -> str:
+        """Encode only the tiles that changed since this monitor's last diff."""
+        digests = screenshot.tile_digests(_DIFF_TILE)
+        previous, age = tile_state.get(screenshot.monitor_index, ({}, _DIFF_REFRESH))
+        full = age >= _DIFF_REFRESH or previous.keys() != digests.keys()
+
+        width, height = screenshot.width, screenshot.height
+        if full:
+            boxes = [(0, 0, width, height)]
+        else:
+            boxes = [
+                (x, y, min(x + _DIFF_TILE, width), min(y + _DIFF_TILE, height))
+                for (x, y), digest in digests.items()
+                if previous[(x, y)] != digest
+            ]
+        tile_state[screenshot.monitor_index] = (digests, 0 if full else age + 1)
+
+        tiles = [
+            {
+                "x": box[0],
+                "y": box[1],
+                "b64": screenshot.crop(box).to_base64(
+                    format=format, max_dimension=max(width, height)
+                ),
+            }
+            for box in boxes
+        ]
+        return _json_dumps({"width": width, "height": height, "full": full, "tiles": tiles})
 
     # ── Screenshot Tool ──────────────────────────────────────────────
 
     @mcp.tool()
-    def take_screenshot(
+    async def take_screenshot(
         monitor: int = 1,
         max_dimension: int = 1568,
+        format: str = "jpeg",
+        return_mode: Literal["base64", "path", "handle", "diff", "shm"] = "base64",
     ) -> str:
         """Capture a screenshot of the current screen.
 
         Args:
             monitor: Monitor index (1 = primary).
             max_dimension: Max pixel dimension for the returned image.
+            format: Image encoding, 'jpeg' (fast, smaller) or 'png' (lossless).
+            return_mode: 'base64' for the encoded image, 'path' for a file:// URI
+                of an uncompressed BMP (overwritten after 8 newer path
+                screenshots), 'handle' for an id to pass to
+                get_screenshot_bytes later, or 'diff' for a JSON manifest of
+                only the native-resolution tiles that changed since the last
+                diff (with a full frame first and every 30 diffs), or 'shm' to
+                skip base64 for same-machine clients: the encoded image is
+                placed in a shared-memory segment returned as
+                'shm://<name>:<size>', which stays alive until passed to
+                release_screenshot (or until 8 newer segments exist).
+
+        Returns:
+            Base64-encoded screenshot, file URI, capture handle, diff JSON, or
+            shared-memory address.
+        """
+        screenshot = await grab(monitor)
+
+        if return_mode == "path":
+            path = await asyncio.to_thread(save_screenshot, screenshot)
+            return path.as_uri()
+        if return_mode == "handle":
+            handle = uuid.uuid4().hex
+            captures[handle] = screenshot
+            while len(captures) > _MAX_HANDLES:
+                captures.popitem(last=False)
+            return handle
+        if return_mode == "diff":
+            return await asyncio.to_thread(diff_screenshot, screenshot, format)
+        if return_mode == "shm":
+            return await asyncio.to_thread(share_screenshot, screenshot, format, max_dimension)
+        return await asyncio.to_thread(
+            screenshot.to_base64, format=format, max_dimension=max_dimension
+        )
+
+    @mcp.tool()
+    async def get_screenshot_bytes(
+        handle: str,
+        max_dimension: int = 1568,
+        format: str = "jpeg",
+    ) -> str:
+        """Encode a screenshot previously captured with return_mode='handle'.
+
+        Args:
+            handle: Id returned by take_screenshot.
+            max_dimension: Max pixel dimension for the returned image.
+            format: Image encoding, 'jpeg' or 'png'.
 
         Returns:
-            Base64-encoded PNG screenshot.
+            Base64-encoded screenshot, or an error message for unknown handles.
         """
-        capture = ScreenCapture(monitor=monitor)
-        screenshot = capture.grab()
-        return screenshot.to_base64(max_dimension=max_dimension)
+        screenshot = captures.get(handle)
+        if screenshot is None:
+            return f"Unknown or expired screenshot handle: {handle}"
+        return await asyncio.to_thread(
+            screenshot.to_base64, format=format, max_dimension=max_dimension
+        )
+
+    @mcp.tool()
+    async def release_screenshot(name: str) -> str:
+        """Free a shared-memory screenshot once it has been read.
+
+        Args:
+            name: Segment name from a take_screenshot(return_mode='shm') address.
+
+        Returns:
+            Success message.
+        """
+        if release_segment(name):
+            return f"Released shared screenshot '{name}'"
+        return f"Unknown or already released shared screenshot: {name}"
 
     # ── Click Tool ───────────────────────────────────────────────────
 
     @mcp.tool()
-    def click(x: int, y: int, button: str = "left", clicks: int = 1) -> str:
+    async def click(x: int, y: int, button: str = "left", clicks: int = 1) -> str:
         """Click at screen coordinates.
 
         Args:
@@ -72,13 +315,9 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Success message.
         """
-        action = Action.click(x, y, f"Click at ({x}, {y})")
-        if clicks == 2:
-            action = Action.double_click(x, y, f"Double-click at ({x}, {y})")
-        elif button == "right":
-            action = Action.right_click(x, y, f"Right-click at ({x}, {y})")
-
-        result = compositor.execute(action)
+        factory, label = _click_action(button, clicks)
+        action = factory(x, y, f"{label} at ({x}, {y})")
+        result = await execute(action)
         if result.success:
             return f"Clicked at ({x}, {y}) successfully"
         return f"Click failed: {result.error}"
@@ -86,7 +325,7 @@ def create_mcp_server() -> FastMCP:
     # ── Type Text Tool ───────────────────────────────────────────────
 
     @mcp.tool()
-    def type_text(text: str) -> str:
+    async def type_text(text: str) -> str:
         """Type text into the currently focused element.
 
         Args:
@@ -95,16 +334,28 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Success message.
         """
-        action = Action.type_text(text, f"Type: {text[:50]}")
-        result = compositor.execute(action)
+        preview = text[:50]
+        if len(text) <= _FAST_TYPE_MAX and text.isprintable():
+            try:
+                async with input_lock:
+                    await asyncio.to_thread(compositor.keyboard.send_text, text)
+                return f"Typed '{preview}' successfully"
+            except PartialInputError as e:
+                # Some characters already landed; retyping would duplicate them
+                return f"Typing failed: {e}"
+            except ActionError:
+                pass  # Nothing was typed; fall back to regular typing
+
+        action = Action.type_text(text, f"Type: {preview}")
+        result = await execute(action)
         if result.success:
-            return f"Typed '{text[:50]}' successfully"
+            return f"Typed '{preview}' successfully"
         return f"Typing failed: {result.error}"
 
     # ── Press Key Tool ───────────────────────────────────────────────
 
     @mcp.tool()
-    def press_key(key: str) -> str:
+    async def press_key(key: str) -> str:
         """Press a keyboard key.
 
         Args:
@@ -114,7 +365,7 @@ def create_mcp_server() -> FastMCP:
             Success message.
         """
         action = Action.press_key(key, f"Press {key}")
-        result = compositor.execute(action)
+        result = await execute(action)
         if result.success:
             return f"Pressed '{key}' successfully"
         return f"Key press failed: {result.error}"
@@ -122,7 +373,7 @@ def create_mcp_server() -> FastMCP:
     # ── Hotkey Tool ──────────────────────────────────────────────────
 
     @mcp.tool()
-    def hotkey(keys: str) -> str:
+    async def hotkey(keys: str) -> str:
         """Press a hotkey combination.
 
         Args:
@@ -131,17 +382,17 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Success message.
         """
-        key_list = [k.strip() for k in keys.split(",")]
-        action = Action.hotkey(*key_list, description=f"Hotkey: {'+'.join(key_list)}")
-        result = compositor.execute(action)
+        key_list, combo = _parse_hotkey(keys)
+        action = Action.hotkey(*key_list, description=f"Hotkey: {combo}")
+        result = await execute(action)
         if result.success:
-            return f"Pressed {'+'.join(key_list)} successfully"
+            return f"Pressed {combo} successfully"
         return f"Hotkey failed: {result.error}"
 
     # ── Scroll Tool ──────────────────────────────────────────────────
 
     @mcp.tool()
-    def scroll(x: int, y: int, direction: str = "down", amount: int = 3) -> str:
+    async def scroll(x: int, y: int, direction: str = "down", amount: int = 3) -> str:
         """Scroll at a specific position.
 
         Args:
@@ -154,31 +405,43 @@ def create_mcp_server() -> FastMCP:
             Success message.
         """
         clicks = -amount if direction == "down" else amount
-        action = Action.scroll(x, y, clicks, f"Scroll {direction} at ({x}, {y})")
-        result = compositor.execute(action)
+        where = f"{direction} at ({x}, {y})"
+        action = Action.scroll(x, y, clicks, f"Scroll {where}")
+        result = await execute(action)
         if result.success:
-            return f"Scrolled {direction} at ({x}, {y})"
+            return f"Scrolled {where}"
         return f"Scroll failed: {result.error}"
 
     # ── Get UI Tree Tool ─────────────────────────────────────────────
 
     @mcp.tool()
-    def get_ui_tree(window_title: Optional[str] = None) -> str:
+    async def get_ui_tree(
+        window_title: Optional[str] = None,
+        ndjson: bool = False,
+        indent: bool = False,
+    ) -> str:
         """Get the accessibility tree of UI elements on screen.
 
         Args:
             window_title: Optional window to scope to (partial match).
+            ndjson: Return one JSON object per line instead of a single array.
+            indent: Pretty-print the array for human reading (ignored for ndjson).
 
         Returns:
-            JSON array of detected UI elements with names, types, and coordinates.
+            Compact JSON array (or NDJSON lines) of detected UI elements with
+            names, types, and coordinates.
         """
-        elements = grounder.detect(window_title=window_title)
-        return json.dumps([e.to_dict() for e in elements], indent=2)
+        elements = await asyncio.to_thread(
+            _com_call, grounder.detect, window_title=window_title
+        )
+        if ndjson:
+            return "\n".join(_json_dumps(e.to_dict()) for e in elements)
+        return _json_dumps([e.to_dict() for e in elements], indent=indent)
 
     # ── Run Shell Command Tool ───────────────────────────────────────
 
     @mcp.tool()
-    def run_shell(command: str, shell_type: str = "powershell") -> str:
+    async def run_shell(command: str, shell_type: str = "powershell") -> str:
         """Execute a shell command.
 
         Args:
@@ -188,13 +451,13 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Command output.
         """
-        result = shell.run(command, shell=shell_type)
+        result = await asyncio.to_thread(shell.run, command, shell=shell_type)
         return f"Exit code: {result.return_code}\n{result.output}"
 
     # ── Open Application Tool ────────────────────────────────────────
 
     @mcp.tool()
-    def open_app(app_name: str) -> str:
+    async def open_app(app_name: str) -> str:
         """Open an application by name.
 
         Args:
@@ -203,7 +466,7 @@ def create_mcp_server() -> FastMCP:
         Returns:
             Success message.
         """
-        result = shell.open_application(app_name)
+        result = await asyncio.to_thread(shell.open_application, app_name)
         if result.success:
             return f"Opened '{app_name}' successfully"
         return f"Failed to open '{app_name}': {result.output}"
@@ -211,13 +474,16 @@ def create_mcp_server() -> FastMCP:
     # ── List Windows Tool ────────────────────────────────────────────
 
     @mcp.tool()
-    def list_windows() -> str:
+    async def list_windows(indent: bool = False) -> str:
         """List all visible windows.
 
+        Args:
+            indent: Pretty-print the JSON for human reading.
+
         Returns:
             JSON array of window information.
         """
-        windows = window_mgr.list_windows()
+        windows = await asyncio.to_thread(_com_call, window_mgr.list_windows)
         data = [
             {
                 "title": w.title,
@@ -228,12 +494,12 @@ def create_mcp_server() -> FastMCP:
             for w in windows
             if w.title  # Only include windows with titles
         ]
-        return json.dumps(data, indent=2)
+        return _json_dumps(data, indent=indent)
 
     # ── Focus Window Tool ────────────────────────────────────────────
 
     @mcp.tool()
-    def focus_window(title: str) -> str:
+    async def focus_window(title: str) -> str:
         """Bring a window to the foreground.
 
         Args:
@@ -243,7 +509,8 @@ def create_mcp_server() -> FastMCP:
             Success message.
         """
         try:
-            window_mgr.focus(title)
+            async with input_lock:
+                await asyncio.to_thread(_com_call, window_mgr.focus, title)
             return f"Focused window matching '{title}'"
         except Exception as e:
             return f"Failed to focus window: {e}"
@@ -251,17 +518,15 @@ def create_mcp_server() -> FastMCP:
     # ── Get Screen Text Tool ─────────────────────────────────────────
 
     @mcp.tool()
-    def get_screen_text() -> str:
+    async def get_screen_text() -> str:
         """Extract all visible text from the current screen using OCR.
 
         Returns:
             All detected text from the screen.
         """
         try:
-            from agenticos.grounding.ocr import OCRGrounder
-            ocr = OCRGrounder()
-            screenshot = screen.grab()
-            return ocr.get_all_text(screenshot)
+            screenshot = await grab()
+            return await asyncio.to_thread(ocr.get_all_text, screenshot)
         except Exception as e:
             return f"OCR failed: {e}"
 
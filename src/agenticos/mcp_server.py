@@ -21,12 +21,16 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
 import json
 import os
+import re
 import signal
 import sys
-import time
 import threading
+import time
+import zlib
 from pathlib import Path
 
 # Add src to path
@@ -37,63 +41,294 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent, ImageContent
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 # Lazy-init singletons
-_screen = None
-_grounder = None
-_compositor = None
-_memory = None
+_http_client = None
+
+
+# Frames younger than this are reused by back-to-back grabs
+_FRAME_REUSE_S = 0.2
+
 
+class _CachedScreen:
+    """ScreenCapture proxy that returns the previous frame if it is fresh.
 
+    Tools that may change the screen call invalidate() once they finish, so
+    a reused frame never predates an input action.
+    """
+
+    def __init__(self, inner) -> None:
+        self.inner = inner
+        self._last = (0.0, None)
+
+    def grab(self):
+        taken, shot = self._last
+        now = time.monotonic()
+        if shot is not None and now - taken < _FRAME_REUSE_S:
+            return shot
+        shot = self.inner.grab()
+        self._last = (now, shot)
+        return shot
+
+    def invalidate(self) -> None:
+        self._last = (0.0, None)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+@functools.lru_cache(maxsize=None)
 def _get_screen():
-    global _screen
-    if _screen is None:
-        from agenticos.observation.screenshot import ScreenCapture
-        _screen = ScreenCapture(monitor=1, scale=1.0)
-    return _screen
+    from agenticos.observation.screenshot import ScreenCapture
+    return _CachedScreen(ScreenCapture(monitor=1, scale=1.0))
+
+
+def _invalidate_frame() -> None:
+    """Drop the reusable frame after input, without creating the capture."""
+    if _get_screen.cache_info().currsize:
+        _get_screen().invalidate()
+
 
+# mss keeps its GDI handles per thread, so the shared capture is only
+# ever grabbed from this one worker
+_capture_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
 
+
+async def _grab(capture):
+    """Grab a frame from ``capture`` on the dedicated capture thread."""
+    return await asyncio.get_running_loop().run_in_executor(_capture_pool, capture.grab)
+
+
+@functools.lru_cache(maxsize=None)
 def _get_grounder():
-    global _grounder
-    if _grounder is None:
-        from agenticos.grounding.accessibility import UIAGrounder
-        _grounder = UIAGrounder()
-    return _grounder
+    from agenticos.grounding.accessibility import UIAGrounder
+    return UIAGrounder()
 
 
+@functools.lru_cache(maxsize=None)
 def _get_compositor():
-    global _compositor
-    if _compositor is None:
-        from agenticos.actions.compositor import ActionCompositor
-        _compositor = ActionCompositor()
-    return _compositor
+    from agenticos.actions.compositor import ActionCompositor
+    return ActionCompositor()
 
 
-def _get_memory():
-    global _memory
-    if _memory is None:
-        from agenticos.agent.step_memory import StepMemory
-        _memory = StepMemory(
-            persist_path=str(ROOT / "recordings" / "step_memory.json")
+@functools.lru_cache(maxsize=None)
+def _get_action_types():
+    """Action class plus an ActionType-by-value table, imported on first use."""
+    from agenticos.actions.compositor import Action, ActionType
+    return Action, {t.value: t for t in ActionType}
+
+
+def _get_http_client():
+    """Keep-alive HTTP client shared by every LLM call (one TLS handshake).
+
+    litellm only takes its async session as a module global, so the client
+    is installed there once, when it is created, rather than on every call.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+        import litellm
+        _http_client = httpx.AsyncClient(
+            timeout=120,
+            limits=httpx.Limits(max_keepalive_connections=4),
         )
-    return _memory
+        litellm.aclient_session = _http_client
+    return _http_client
+
+
+@functools.lru_cache(maxsize=None)
+def _get_memory():
+    from agenticos.agent.step_memory import StepMemory
+    return StepMemory(
+        persist_path=str(ROOT / "recordings" / "step_memory.json")
+    )
+
+
+# Azure AD credential and (token, expires_on), reused across tasks
+_AZURE_SCOPE = "https://cognitiveservices.azure.com/.default"
+_TOKEN_REFRESH_MARGIN_S = 300
+_azure_credential = None
+_azure_token_cache: tuple[str, float] | None = None
+
+
+def _azure_token() -> str:
+    """Azure AD token for the LLM endpoint, refreshed 5 min before expiry."""
+    global _azure_credential, _azure_token_cache
+    token = os.environ.get("AZURE_AD_TOKEN", "")
+    if token:
+        return token
+    if _azure_token_cache and time.time() < _azure_token_cache[1] - _TOKEN_REFRESH_MARGIN_S:
+        return _azure_token_cache[0]
+    if _azure_credential is None:
+        from azure.identity import DefaultAzureCredential
+        _azure_credential = DefaultAzureCredential()
+    access = _azure_credential.get_token(_AZURE_SCOPE)
+    _azure_token_cache = (access.token, access.expires_on)
+    return access.token
+
+
+# Recent UIA scans keyed by (foreground window, screenshot checksum)
+_UIA_CACHE_SIZE = 8
+_uia_cache: dict[tuple[int, int], list] = {}
+
+# Reused watchdog threads for UIA scans (a hung scan occupies one worker)
+_UIA_WORKERS = 2
+_uia_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_UIA_WORKERS, thread_name_prefix="uia"
+)
+# Pool workers still stuck in a scan that timed out
+_uia_stuck = 0
+_uia_stuck_lock = threading.Lock()
+
+_JSON_START = re.compile(r"\{")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _foreground_window() -> int:
+    """Handle of the foreground window (0 if unavailable)."""
+    try:
+        import ctypes
+        return ctypes.windll.user32.GetForegroundWindow() or 0
+    except Exception:
+        return 0
+
+
+def _frame_fingerprint(shot) -> int:
+    """CRC32 of every pixel in a screenshot (about 5 ms for a 1080p frame).
+
+    ``tobytes()`` copies the whole frame once. Sampling a sparse grid avoided
+    that copy but missed typed text, toggled checkboxes and other small
+    changes, so stale UIA scans looked fresh.
+    """
+    return zlib.crc32(shot.image.tobytes())
 
 
-def _detect_with_timeout(timeout: float = 12.0) -> list:
-    """Run UIA detection with a timeout to avoid hangs."""
-    elements = []
-    done = threading.Event()
+def _screen_key(shot) -> tuple[int, int]:
+    """Cache key for a screenshot: foreground window + full-frame checksum."""
+    return _foreground_window(), _frame_fingerprint(shot)
 
-    def _detect():
-        nonlocal elements
+
+async def _wait_ui_settled(screen, max_s: float = 1.0, poll: float = 0.05) -> None:
+    """Wait until two consecutive frames match, for at most max_s seconds.
+
+    Replaces a fixed post-action sleep: snappy UIs settle in a few polls,
+    slow ones still get the full max_s.
+    """
+    capture = getattr(screen, "inner", screen)  # bypass the frame-reuse cache
+    deadline = time.monotonic() + max_s
+    previous = None
+    while time.monotonic() < deadline:
+        await asyncio.sleep(poll)
         try:
-            elements = _get_grounder().detect()
+            current = await asyncio.to_thread(_frame_fingerprint, await _grab(capture))
         except Exception:
-            elements = []
-        done.set()
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+            return
+        if current == previous:
+            return
+        previous = current
+
+
+def _parse_action_json(content: str) -> dict:
+    """Extract the first JSON object with an "action" key from an LLM reply.
+
+    Decodes forward from each '{' with raw_decode, which is linear in the
+    object's length, instead of a backtracking '.*"action".*' regex. The
+    stdlib decoder is used here because orjson has no raw_decode.
+    """
+    for m in _JSON_START.finditer(content):
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(content, m.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict) and "action" in parsed:
+            return parsed
+    return _json_loads(content)
+
+
+def _submit_detect() -> tuple[concurrent.futures.Future, bool]:
+    """Start a UIA scan, returning its future and whether it runs on the pool.
+
+    Once every pool worker is stuck in a hung scan, scans run on a fresh
+    daemon thread instead, so grounding keeps working until a stuck worker
+    comes back.
+    """
+    detect = _get_grounder().detect
+    with _uia_stuck_lock:
+        pool_free = _uia_stuck < _UIA_WORKERS
+    if pool_free:
+        return _uia_pool.submit(detect), True
+
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(detect())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="uia-fallback", daemon=True).start()
+    return future, False
+
+
+def _mark_stuck(future: concurrent.futures.Future) -> None:
+    """Count a timed-out pool scan as a stuck worker until it finishes."""
+    global _uia_stuck
+    with _uia_stuck_lock:
+        _uia_stuck += 1
+
+    def release(_: concurrent.futures.Future) -> None:
+        global _uia_stuck
+        with _uia_stuck_lock:
+            _uia_stuck -= 1
+
+    future.add_done_callback(release)
 
-    t = threading.Thread(target=_detect, daemon=True)
-    t.start()
-    done.wait(timeout=timeout)
+
+def _detect_with_timeout(
+    timeout: float = 12.0,
+    cache_key: tuple[int, int] | None = None,
+    max_elements: int | None = None,
+) -> list:
+    """Run UIA detection with a timeout to avoid hangs.
+
+    When cache_key is given, a previous scan of the same (unchanged) screen
+    is reused instead of walking the UIA tree again. max_elements truncates
+    the result before it is cached, so dropped elements are not retained.
+    """
+    if cache_key is not None and cache_key in _uia_cache:
+        return list(_uia_cache[cache_key])
+
+    future, pooled = _submit_detect()
+    try:
+        elements = future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        if not future.cancel() and pooled:
+            _mark_stuck(future)
+        return []
+    except Exception:
+        return []
+
+    elements = elements[:max_elements]
+    if elements and cache_key is not None:
+        _uia_cache[cache_key] = list(elements)
+        while len(_uia_cache) > _UIA_CACHE_SIZE:
+            del _uia_cache[next(iter(_uia_cache))]
     return elements
 
 
@@ -104,364 +339,427 @@ def _detect_with_timeout(timeout: float = 12.0) -> list:
 app = Server("agenticos")
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="screenshot",
-            description="Capture a screenshot of the current screen. Returns a base64-encoded PNG image.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "max_dimension": {
-                        "type": "integer",
-                        "description": "Max pixel dimension (default 1568)",
-                        "default": 1568,
-                    }
-                },
-            },
+# Static tool schemas, built once at import and returned on every list_tools
+_TOOLS: list[Tool] = [
+    Tool(
+        name="screenshot",
+        description=(
+            "Capture a screenshot of the current screen. "
+            "Returns a base64-encoded PNG image."
         ),
-        Tool(
-            name="detect_elements",
-            description="Detect all interactive UI elements on screen using Windows UI Automation. Returns element names, types, and coordinates.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {
-                        "type": "string",
-                        "description": "Optional: only detect elements in this window",
-                    },
-                    "max_elements": {
-                        "type": "integer",
-                        "description": "Maximum elements to return (default 50)",
-                        "default": 50,
-                    },
-                },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_dimension": {
+                    "type": "integer",
+                    "description": "Max pixel dimension (default 1568)",
+                    "default": 1568,
+                }
             },
+        },
+    ),
+    Tool(
+        name="detect_elements",
+        description=(
+            "Detect all interactive UI elements on screen using Windows UI Automation. "
+            "Returns element names, types, and coordinates."
         ),
-        Tool(
-            name="click",
-            description="Click at screen coordinates (x, y).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {
+                    "type": "string",
+                    "description": "Optional: only detect elements in this window",
                 },
-                "required": ["x", "y"],
-            },
-        ),
-        Tool(
-            name="double_click",
-            description="Double-click at screen coordinates (x, y).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"},
+                "max_elements": {
+                    "type": "integer",
+                    "description": "Maximum elements to return (default 50)",
+                    "default": 50,
                 },
-                "required": ["x", "y"],
             },
-        ),
-        Tool(
-            name="right_click",
-            description="Right-click at screen coordinates (x, y).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"},
-                },
-                "required": ["x", "y"],
+        },
+    ),
+    Tool(
+        name="click",
+        description="Click at screen coordinates (x, y).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"},
             },
-        ),
-        Tool(
-            name="type_text",
-            description="Type text at the current cursor position. Supports Unicode.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {"type": "string", "description": "Text to type"},
-                },
-                "required": ["text"],
+            "required": ["x", "y"],
+        },
+    ),
+    Tool(
+        name="double_click",
+        description="Double-click at screen coordinates (x, y).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"},
             },
-        ),
-        Tool(
-            name="press_key",
-            description="Press a keyboard key (enter, tab, escape, f1, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {"type": "string", "description": "Key name to press"},
-                },
-                "required": ["key"],
+            "required": ["x", "y"],
+        },
+    ),
+    Tool(
+        name="right_click",
+        description="Right-click at screen coordinates (x, y).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"},
             },
-        ),
-        Tool(
-            name="hotkey",
-            description="Press a keyboard shortcut (e.g. ctrl+c, alt+tab).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keys": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keys to press simultaneously, e.g. ['ctrl', 'c']",
-                    },
-                },
-                "required": ["keys"],
+            "required": ["x", "y"],
+        },
+    ),
+    Tool(
+        name="type_text",
+        description="Type text at the current cursor position. Supports Unicode.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {"type": "string", "description": "Text to type"},
             },
-        ),
-        Tool(
-            name="scroll",
-            description="Scroll the mouse wheel at a position.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"},
-                    "clicks": {"type": "integer", "description": "Scroll clicks (negative=down, positive=up)", "default": -3},
-                },
-                "required": ["x", "y"],
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="press_key",
+        description="Press a keyboard key (enter, tab, escape, f1, etc.).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {"type": "string", "description": "Key name to press"},
             },
-        ),
-        Tool(
-            name="open_app",
-            description="Open a Windows application by name (e.g. 'notepad', 'msedge', 'outlook').",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {"type": "string", "description": "Application name to launch"},
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="hotkey",
+        description="Press a keyboard shortcut (e.g. ctrl+c, alt+tab).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keys to press simultaneously, e.g. ['ctrl', 'c']",
                 },
-                "required": ["app_name"],
             },
-        ),
-        Tool(
-            name="shell",
-            description="Run a PowerShell command and return the output.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {"type": "string", "description": "PowerShell command to run"},
-                    "timeout": {"type": "integer", "description": "Timeout in seconds (default 30)", "default": 30},
+            "required": ["keys"],
+        },
+    ),
+    Tool(
+        name="scroll",
+        description="Scroll the mouse wheel at a position.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"},
+                "clicks": {
+                    "type": "integer",
+                    "description": "Scroll clicks (negative=down, positive=up)",
+                    "default": -3,
                 },
-                "required": ["command"],
             },
-        ),
-        Tool(
-            name="focus_window",
-            description="Bring a window to the foreground by title.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Window title (partial match)"},
-                },
-                "required": ["title"],
+            "required": ["x", "y"],
+        },
+    ),
+    Tool(
+        name="open_app",
+        description="Open a Windows application by name (e.g. 'notepad', 'msedge', 'outlook').",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {"type": "string", "description": "Application name to launch"},
             },
-        ),
-        Tool(
-            name="list_windows",
-            description="List all visible windows with their titles, handles, and positions.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="run_task",
-            description="Run a full agent loop for a natural-language task. The agent will observe the screen, think, and act until the task is done.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task": {"type": "string", "description": "Natural language description of the task"},
-                    "max_steps": {"type": "integer", "description": "Maximum steps (default 15)", "default": 15},
+            "required": ["app_name"],
+        },
+    ),
+    Tool(
+        name="shell",
+        description="Run a PowerShell command and return the output.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {"type": "string", "description": "PowerShell command to run"},
+                "timeout": {
+                    "type": "integer",
+                    "description": "Timeout in seconds (default 30)",
+                    "default": 30,
                 },
-                "required": ["task"],
             },
+            "required": ["command"],
+        },
+    ),
+    Tool(
+        name="focus_window",
+        description="Bring a window to the foreground by title.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Window title (partial match)"},
+            },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="list_windows",
+        description="List all visible windows with their titles, handles, and positions.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="run_task",
+        description=(
+            "Run a full agent loop for a natural-language task. "
+            "The agent will observe the screen, think, and act until the task is done."
         ),
-        Tool(
-            name="record_demo",
-            description="Run a task with GIF recording. Returns the path to the saved GIF.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task": {"type": "string", "description": "Task description"},
-                    "output": {"type": "string", "description": "Output GIF path (default recordings/demo.gif)", "default": "recordings/demo.gif"},
-                    "max_steps": {"type": "integer", "description": "Max steps (default 15)", "default": 15},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task": {
+                    "type": "string",
+                    "description": "Natural language description of the task",
+                },
+                "max_steps": {
+                    "type": "integer",
+                    "description": "Maximum steps (default 15)",
+                    "default": 15,
                 },
-                "required": ["task"],
             },
-        ),
-        Tool(
-            name="get_memory_stats",
-            description="Get statistics about the step memory cache (hits, misses, stored episodes).",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="go_back",
-            description="Attempt to go back to the previous UI state using common patterns (Escape, Alt+Left, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "strategy": {
-                        "type": "string",
-                        "description": "Recovery strategy: escape, alt_left, alt_f4, ctrl_z, ctrl_w",
-                        "default": "escape",
-                    },
+            "required": ["task"],
+        },
+    ),
+    Tool(
+        name="record_demo",
+        description="Run a task with GIF recording. Returns the path to the saved GIF.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task": {"type": "string", "description": "Task description"},
+                "output": {
+                    "type": "string",
+                    "description": "Output GIF path (default recordings/demo.gif)",
+                    "default": "recordings/demo.gif",
+                },
+                "max_steps": {
+                    "type": "integer",
+                    "description": "Max steps (default 15)",
+                    "default": 15,
                 },
             },
+            "required": ["task"],
+        },
+    ),
+    Tool(
+        name="get_memory_stats",
+        description="Get statistics about the step memory cache (hits, misses, stored episodes).",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="go_back",
+        description=(
+            "Attempt to go back to the previous UI state "
+            "using common patterns (Escape, Alt+Left, etc.)."
         ),
-        Tool(
-            name="drag",
-            description="Drag from one position to another (for sliders, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_x": {"type": "integer"},
-                    "start_y": {"type": "integer"},
-                    "end_x": {"type": "integer"},
-                    "end_y": {"type": "integer"},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "strategy": {
+                    "type": "string",
+                    "description": "Recovery strategy: escape, alt_left, alt_f4, ctrl_z, ctrl_w",
+                    "default": "escape",
                 },
-                "required": ["start_x", "start_y", "end_x", "end_y"],
             },
-        ),
+        },
+    ),
+    Tool(
+        name="drag",
+        description="Drag from one position to another (for sliders, etc.).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_x": {"type": "integer"},
+                "start_y": {"type": "integer"},
+                "end_x": {"type": "integer"},
+                "end_y": {"type": "integer"},
+            },
+            "required": ["start_x", "start_y", "end_x", "end_y"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
+
+
+# ── Observation tools ──
+
+async def _tool_screenshot(arguments: dict) -> list[TextContent | ImageContent]:
+    shot = await _grab(_get_screen())
+    max_dim = arguments.get("max_dimension", 1568)
+    b64 = shot.to_base64(max_dimension=max_dim)
+    return [
+        TextContent(type="text", text=f"Screenshot: {shot.width}x{shot.height}"),
+        ImageContent(type="image", data=b64, mimeType="image/png"),
     ]
 
 
+async def _tool_detect_elements(arguments: dict) -> list[TextContent]:
+    elements = _detect_with_timeout(timeout=12.0)
+    max_el = arguments.get("max_elements", 50)
+    descs = [el.description() for el in elements[:max_el]]
+    if len(elements) > max_el:
+        descs.append(f"... ({len(elements) - max_el} more)")
+    text = f"Detected {len(elements)} elements:\n" + "\n".join(descs)
+    return [TextContent(type="text", text=text)]
+
+
+# ── Input action tools ──
+
+def _input_tool(action_type: str):
+    """Handler that forwards its arguments as a compositor action."""
+    async def handler(arguments: dict) -> list[TextContent]:
+        ok, msg = execute_action_mcp(action_type, arguments)
+        return [TextContent(type="text", text=msg)]
+    return handler
+
+
+# ── App/Window tools ──
+
+async def _tool_open_app(arguments: dict) -> list[TextContent]:
+    ok, msg = execute_action_mcp("open_app", arguments)
+    await asyncio.sleep(1.5)
+    return [TextContent(type="text", text=msg)]
+
+
+async def _tool_shell(arguments: dict) -> list[TextContent]:
+    from agenticos.actions.shell import ShellExecutor
+    shell = ShellExecutor()
+    result = shell.run(
+        arguments["command"],
+        timeout=arguments.get("timeout", 30),
+    )
+    _invalidate_frame()
+    return [TextContent(type="text", text=f"Exit {result.return_code}:\n{result.output}")]
+
+
+async def _tool_focus_window(arguments: dict) -> list[TextContent]:
+    from agenticos.actions.window import WindowManager
+    wm = WindowManager()
+    wm.focus(arguments["title"])
+    _invalidate_frame()
+    return [TextContent(type="text", text=f"Focused window matching '{arguments['title']}'")]
+
+
+async def _tool_list_windows(arguments: dict) -> list[TextContent]:
+    from agenticos.actions.window import WindowManager
+    wm = WindowManager()
+    windows = wm.list_windows()
+    lines = [f"  {w.title} (pid={w.pid}, handle={w.handle})" for w in windows[:30]]
+    return [TextContent(type="text", text=f"{len(windows)} windows:\n" + "\n".join(lines))]
+
+
+# ── Recovery ──
+
+_GO_BACK_ACTIONS = {
+    "escape": ("press_key", {"key": "escape"}),
+    "alt_left": ("hotkey", {"keys": ["alt", "left"]}),
+    "alt_f4": ("hotkey", {"keys": ["alt", "F4"]}),
+    "ctrl_z": ("hotkey", {"keys": ["ctrl", "z"]}),
+    "ctrl_w": ("hotkey", {"keys": ["ctrl", "w"]}),
+}
+
+
+async def _tool_go_back(arguments: dict) -> list[TextContent]:
+    strategy = arguments.get("strategy", "escape")
+    act_type, act_params = _GO_BACK_ACTIONS.get(strategy, _GO_BACK_ACTIONS["escape"])
+    ok, msg = execute_action_mcp(act_type, act_params)
+    return [TextContent(type="text", text=f"Recovery ({strategy}): {msg}")]
+
+
+# ── Memory ──
+
+async def _tool_get_memory_stats(arguments: dict) -> list[TextContent]:
+    mem = _get_memory()
+    return [TextContent(type="text", text=_json_dumps_pretty(mem.stats))]
+
+
+# ── Agent loop ──
+
+async def _tool_run_task(arguments: dict) -> list[TextContent]:
+    result = await _run_agent_task(
+        task=arguments["task"],
+        max_steps=arguments.get("max_steps", 15),
+    )
+    return [TextContent(type="text", text=result)]
+
+
+async def _tool_record_demo(arguments: dict) -> list[TextContent]:
+    result = await _run_agent_task(
+        task=arguments["task"],
+        max_steps=arguments.get("max_steps", 15),
+        record_gif=arguments.get("output", "recordings/demo.gif"),
+    )
+    return [TextContent(type="text", text=result)]
+
+
+# Tool name -> handler, resolved with one dict lookup per call
+_HANDLERS = {
+    "screenshot": _tool_screenshot,
+    "detect_elements": _tool_detect_elements,
+    **{
+        name: _input_tool(name)
+        for name in (
+            "click", "double_click", "right_click", "type_text",
+            "press_key", "hotkey", "scroll", "drag",
+        )
+    },
+    "open_app": _tool_open_app,
+    "shell": _tool_shell,
+    "focus_window": _tool_focus_window,
+    "list_windows": _tool_list_windows,
+    "go_back": _tool_go_back,
+    "get_memory_stats": _tool_get_memory_stats,
+    "run_task": _tool_run_task,
+    "record_demo": _tool_record_demo,
+}
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
     try:
-        match name:
-            # ── Observation tools ──
-            case "screenshot":
-                scr = _get_screen()
-                shot = scr.grab()
-                max_dim = arguments.get("max_dimension", 1568)
-                b64 = shot.to_base64(max_dimension=max_dim)
-                return [
-                    TextContent(type="text", text=f"Screenshot: {shot.width}x{shot.height}"),
-                    ImageContent(type="image", data=b64, mimeType="image/png"),
-                ]
-
-            case "detect_elements":
-                elements = _detect_with_timeout(timeout=12.0)
-                max_el = arguments.get("max_elements", 50)
-                descs = [el.description() for el in elements[:max_el]]
-                if len(elements) > max_el:
-                    descs.append(f"... ({len(elements) - max_el} more)")
-                return [TextContent(type="text", text=f"Detected {len(elements)} elements:\n" + "\n".join(descs))]
-
-            # ── Input action tools ──
-            case "click":
-                ok, msg = execute_action_mcp("click", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "double_click":
-                ok, msg = execute_action_mcp("double_click", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "right_click":
-                ok, msg = execute_action_mcp("right_click", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "type_text":
-                ok, msg = execute_action_mcp("type_text", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "press_key":
-                ok, msg = execute_action_mcp("press_key", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "hotkey":
-                ok, msg = execute_action_mcp("hotkey", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "scroll":
-                ok, msg = execute_action_mcp("scroll", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            case "drag":
-                ok, msg = execute_action_mcp("drag", arguments)
-                return [TextContent(type="text", text=msg)]
-
-            # ── App/Window tools ──
-            case "open_app":
-                ok, msg = execute_action_mcp("open_app", arguments)
-                await asyncio.sleep(1.5)
-                return [TextContent(type="text", text=msg)]
-
-            case "shell":
-                from agenticos.actions.shell import ShellExecutor
-                shell = ShellExecutor()
-                result = shell.run(
-                    arguments["command"],
-                    timeout=arguments.get("timeout", 30),
-                )
-                return [TextContent(type="text", text=f"Exit {result.return_code}:\n{result.output}")]
-
-            case "focus_window":
-                from agenticos.actions.window import WindowManager
-                wm = WindowManager()
-                wm.focus(arguments["title"])
-                return [TextContent(type="text", text=f"Focused window matching '{arguments['title']}'")]
-
-            case "list_windows":
-                from agenticos.actions.window import WindowManager
-                wm = WindowManager()
-                windows = wm.list_windows()
-                lines = [f"  {w.title} (pid={w.pid}, handle={w.handle})" for w in windows[:30]]
-                return [TextContent(type="text", text=f"{len(windows)} windows:\n" + "\n".join(lines))]
-
-            # ── Recovery ──
-            case "go_back":
-                strategy = arguments.get("strategy", "escape")
-                STRATEGY_ACTIONS = {
-                    "escape": ("press_key", {"key": "escape"}),
-                    "alt_left": ("hotkey", {"keys": ["alt", "left"]}),
-                    "alt_f4": ("hotkey", {"keys": ["alt", "F4"]}),
-                    "ctrl_z": ("hotkey", {"keys": ["ctrl", "z"]}),
-                    "ctrl_w": ("hotkey", {"keys": ["ctrl", "w"]}),
-                }
-                act_type, act_params = STRATEGY_ACTIONS.get(strategy, ("press_key", {"key": "escape"}))
-                ok, msg = execute_action_mcp(act_type, act_params)
-                return [TextContent(type="text", text=f"Recovery ({strategy}): {msg}")]
-
-            # ── Memory ──
-            case "get_memory_stats":
-                mem = _get_memory()
-                return [TextContent(type="text", text=json.dumps(mem.stats, indent=2))]
-
-            # ── Agent loop ──
-            case "run_task":
-                result = await _run_agent_task(
-                    task=arguments["task"],
-                    max_steps=arguments.get("max_steps", 15),
-                )
-                return [TextContent(type="text", text=result)]
-
-            case "record_demo":
-                result = await _run_agent_task(
-                    task=arguments["task"],
-                    max_steps=arguments.get("max_steps", 15),
-                    record_gif=arguments.get("output", "recordings/demo.gif"),
-                )
-                return [TextContent(type="text", text=result)]
-
-            case _:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
+        return await handler(arguments)
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {e}")]
 
 
 def execute_action_mcp(action_type: str, params: dict) -> tuple[bool, str]:
     """Execute an action via the compositor."""
-    from agenticos.actions.compositor import Action, ActionType
+    action_cls, action_types = _get_action_types()
+    at = action_types.get(action_type)
+    if at is None:
+        return False, f"Error: unknown action type {action_type!r}"
     try:
-        action = Action(type=ActionType(action_type), params=params)
+        action = action_cls(type=at, params=params)
         result = _get_compositor().execute(action)
         if result.success:
             return True, f"OK: {action_type} executed"
         return False, f"Failed: {result.error}"
     except Exception as e:
         return False, f"Error: {e}"
+    finally:
+        # Frames grabbed before or during the action no longer match the screen
+        _invalidate_frame()
 
 
 async def _run_agent_task(
@@ -470,21 +768,18 @@ async def _run_agent_task(
     record_gif: str | None = None,
 ) -> str:
     """Run the full agent observe-think-act loop."""
-    import re
     import litellm
     from agenticos.agent.state_validator import StateValidator
     from agenticos.agent.recovery import RecoveryManager
     from agenticos.observation.recorder import GifRecorder
 
+    _get_http_client()  # installs the keep-alive session on first run
+
     # Get Azure AD token
-    token = os.environ.get("AZURE_AD_TOKEN", "")
-    if not token:
-        try:
-            from azure.identity import DefaultAzureCredential
-            cred = DefaultAzureCredential()
-            token = cred.get_token("https://cognitiveservices.azure.com/.default").token
-        except Exception as e:
-            return f"Error getting Azure AD token: {e}"
+    try:
+        token = _azure_token()
+    except Exception as e:
+        return f"Error getting Azure AD token: {e}"
 
     validator = StateValidator()
     recovery_mgr = RecoveryManager()
@@ -509,28 +804,30 @@ async def _run_agent_task(
     )
 
     for step_num in range(1, max_steps + 1):
-        # Observe
+        # Observe: encode the frame while UIA scans the same screen
         try:
-            shot = screen.grab()
-            b64 = shot.to_base64()
+            shot = await _grab(screen)
+            b64, elements = await asyncio.gather(
+                asyncio.to_thread(shot.to_base64, format="JPEG", max_dimension=1280),
+                asyncio.to_thread(_detect_with_timeout, 10.0, _screen_key(shot), 40),
+            )
         except Exception as e:
             log_lines.append(f"Step {step_num}: Screenshot error: {e}")
             break
 
-        elements = _detect_with_timeout(timeout=10.0)
-        elem_text = "\n".join(el.description() for el in elements[:40])
+        elem_text = "\n".join(el.description() for el in elements)
 
         # LLM
         messages = [
             {"role": "system", "content": PROMPT},
             {"role": "user", "content": [
                 {"type": "text", "text": f"Task: {task}\n\nUI Elements:\n{elem_text}\n\nNext action?"},
-                {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}},
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{b64}"}},
             ]},
         ]
 
         try:
-            resp = litellm.completion(
+            resp = await litellm.acompletion(
                 model="azure/gpt-4o",
                 messages=messages,
                 max_tokens=2048,
@@ -546,8 +843,7 @@ async def _run_agent_task(
 
         # Parse
         try:
-            m = re.search(r'\{.*"action".*\}', content, re.DOTALL)
-            parsed = json.loads(m.group()) if m else json.loads(content)
+            parsed = _parse_action_json(content)
             act = parsed.get("action", {})
             thought = parsed.get("thought", "")
             action_type = act.get("type", "done")
@@ -566,7 +862,7 @@ async def _run_agent_task(
         TYPE_MAP = {"type": "type_text", "key_press": "press_key", "key": "press_key", "open": "open_app"}
         mapped = TYPE_MAP.get(action_type, action_type)
         execute_action_mcp(mapped, params)
-        await asyncio.sleep(1.0)
+        await _wait_ui_settled(screen)
 
         if recorder:
             try:
@@ -588,10 +884,24 @@ async def _run_agent_task(
     return f"{status} ({len(steps)} steps)\n" + "\n".join(log_lines) + gif_msg
 
 
+def _warm_imports() -> None:
+    """Import the agent loop's heavy dependencies ahead of the first run_task call."""
+    for name in ("litellm", "azure.identity"):
+        try:
+            __import__(name)
+        except Exception:
+            pass  # the agent loop reports missing dependencies itself
+
+
 async def main():
     """Run the MCP server over stdio."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    threading.Thread(target=_warm_imports, name="warm-imports", daemon=True).start()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        if _http_client is not None:
+            await _http_client.aclose()
 
 
 if __name__ == "__main__":
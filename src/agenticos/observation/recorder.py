@@ -7,13 +7,17 @@ optimized GIF files suitable for GitHub issue embedding (<10MB).
 from __future__ import annotations
 
 import io
+import os
+import queue
 import threading
 import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-import imageio
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
@@ -28,10 +32,12 @@ class RecordingFrame:
         image: RGB numpy array (H, W, 3).
         timestamp: Unix timestamp.
         annotation: Optional text annotation to overlay.
+        repeats: Number of consecutive capture intervals the frame was on screen.
     """
     image: np.ndarray
     timestamp: float
     annotation: Optional[str] = None
+    repeats: int = 1
 
 
 class GifRecorder:
@@ -57,6 +63,7 @@ class GifRecorder:
         scale: float = 0.5,
         monitor: int = 1,
         max_width: int = 720,
+        resample: Image.Resampling = Image.Resampling.BILINEAR,
     ) -> None:
         """Initialize the GIF recorder.
 
@@ -66,36 +73,59 @@ class GifRecorder:
             scale: Scale factor for captured frames.
             monitor: Monitor index to capture.
             max_width: Maximum width for output GIF (for size optimization).
+            resample: Filter used to downscale frames to max_width. Bilinear is
+                indistinguishable from Lanczos once quantized to a 255-colour
+                palette at a fraction of the cost; pass LANCZOS for sharper text.
         """
         self.fps = fps
         self.max_duration = max_duration
         self.scale = scale
         self.monitor = monitor
         self.max_width = max_width
+        self.resample = resample
 
-        self._frames: list[RecordingFrame] = []
+        # Frames are stored already downscaled to max_width, and at most
+        # fps * max_duration of them are kept, which bounds memory use
+        self._capacity = max(1, fps * max_duration)
+        self._frames: deque[RecordingFrame] = deque(maxlen=self._capacity)
+        self._frame_ratio = 1.0  # stored frame width / captured frame width
         self._recording = False
         self._thread: Optional[threading.Thread] = None
+        # Captured frames are handed to an encoder thread that downscales them,
+        # so the capture thread only grabs and annotates; None ends the stream
+        self._encode_q: queue.Queue[Optional[RecordingFrame]] = queue.Queue(maxsize=32)
+        self._encoder: Optional[threading.Thread] = None
         self._capture = ScreenCapture(monitor=monitor, scale=scale)
         self._current_annotation: Optional[str] = None
         self._lock = threading.Lock()
 
+        # Overlay font, loaded once rather than per annotated frame
+        try:
+            self._font = ImageFont.truetype("arial.ttf", 16)
+        except (OSError, IOError):
+            self._font = ImageFont.load_default()
+
     def start(self) -> None:
-        """Start recording in a background thread."""
+        """Start recording in background capture and encoder threads."""
         if self._recording:
             return
 
-        self._frames = []
+        self._frames = deque(maxlen=self._capacity)
         self._recording = True
+        self._encoder = threading.Thread(target=self._encode_loop, daemon=True)
+        self._encoder.start()
         self._thread = threading.Thread(target=self._record_loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
-        """Stop recording."""
+        """Stop recording and wait for queued frames to be processed."""
         self._recording = False
         if self._thread is not None:
             self._thread.join(timeout=5.0)
             self._thread = None
+        if self._encoder is not None:
+            self._encoder.join(timeout=5.0)
+            self._encoder = None
 
     def add_annotation(self, text: str) -> None:
         """Set annotation text to overlay on subsequent frames.
@@ -122,18 +152,21 @@ class GifRecorder:
 
         Args:
             frame_idx: Index of the frame to annotate.
-            bbox: (left, top, right, bottom) in pixels.
+            bbox: (left, top, right, bottom) in captured-frame pixels.
             label: Optional label text above the box.
             color: Box color name.
         """
-        if 0 <= frame_idx < len(self._frames):
+        with self._lock:
+            if not 0 <= frame_idx < len(self._frames):
+                return
             frame = self._frames[frame_idx]
-            img = Image.fromarray(frame.image)
-            draw = ImageDraw.Draw(img)
-            draw.rectangle(bbox, outline=color, width=3)
-            if label:
-                draw.text((bbox[0], bbox[1] - 15), label, fill=color)
-            frame.image = np.array(img)
+        bbox = tuple(round(v * self._frame_ratio) for v in bbox)
+        img = Image.fromarray(frame.image)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle(bbox, outline=color, width=3)
+        if label:
+            draw.text((bbox[0], bbox[1] - 15), label, fill=color)
+        frame.image = np.asarray(img)
 
     @property
     def frame_count(self) -> int:
@@ -146,42 +179,79 @@ class GifRecorder:
         return self._recording
 
     def _record_loop(self) -> None:
-        """Background recording loop."""
+        """Background recording loop; hands frames to the encoder thread.
+
+        Capture slots are scheduled on the monotonic clock at fixed offsets from
+        the start, so wall-clock jumps and slow captures do not drift the FPS.
+        Every slot is accounted to some frame's ``repeats`` to keep GIF timing.
+        """
         interval = 1.0 / self.fps
-        start_time = time.time()
+        start = time.monotonic()
+        slot = 0
+        last: Optional[RecordingFrame] = None
+        last_sig: Optional[int] = None
 
-        while self._recording:
-            elapsed = time.time() - start_time
-            if elapsed >= self.max_duration:
-                self._recording = False
+        try:
+            while self._recording:
+                if time.monotonic() - start >= self.max_duration:
+                    self._recording = False
+                    break
+
+                try:
+                    frame_array, _ = self._capture.grab_numpy()
+
+                    # Apply annotation if set
+                    with self._lock:
+                        annotation = self._current_annotation
+
+                    if annotation:
+                        frame_array = self._overlay_text(frame_array, annotation)
+
+                    # An unchanged screen extends the previous frame instead of
+                    # queueing a duplicate for every capture interval
+                    sig = zlib.crc32(np.ascontiguousarray(frame_array))
+                    if last is not None and sig == last_sig:
+                        last.repeats += 1
+                    else:
+                        last = RecordingFrame(
+                            image=frame_array,
+                            timestamp=time.time(),
+                            annotation=annotation,
+                        )
+                        last_sig = sig
+                        self._encode_q.put(last)
+                except Exception:
+                    # Skip failed frames silently; the previous one stays on screen
+                    if last is not None:
+                        last.repeats += 1
+                slot += 1
+
+                # Slots missed by a slow capture are skipped, not caught up in a burst
+                now = time.monotonic()
+                behind = int((now - start) / interval) - slot
+                if behind > 0:
+                    slot += behind
+                    if last is not None:
+                        last.repeats += behind
+
+                # Sleep until next frame
+                sleep_time = start + slot * interval - now
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+        finally:
+            self._encode_q.put(None)
+
+    def _encode_loop(self) -> None:
+        """Background encoder loop: downscale queued frames into the frame store."""
+        while True:
+            frame = self._encode_q.get()
+            if frame is None:
                 break
-
-            try:
-                screenshot = self._capture.grab()
-                frame_array = screenshot.to_numpy()
-
-                # Apply annotation if set
-                with self._lock:
-                    annotation = self._current_annotation
-
-                if annotation:
-                    frame_array = self._overlay_text(frame_array, annotation)
-
-                self._frames.append(
-                    RecordingFrame(
-                        image=frame_array,
-                        timestamp=time.time(),
-                        annotation=annotation,
-                    )
-                )
-            except Exception:
-                pass  # Skip failed frames silently
-
-            # Sleep until next frame
-            next_frame_time = start_time + (len(self._frames)) * interval
-            sleep_time = next_frame_time - time.time()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            stored = self._downscale(frame.image)
+            self._frame_ratio = stored.shape[1] / frame.image.shape[1]
+            frame.image = stored
+            with self._lock:
+                self._frames.append(frame)
 
     def _overlay_text(self, frame: np.ndarray, text: str) -> np.ndarray:
         """Overlay annotation text on a frame.
@@ -196,30 +266,22 @@ class GifRecorder:
         img = Image.fromarray(frame)
         draw = ImageDraw.Draw(img)
 
-        # Draw semi-transparent background bar
+        # Draw background bar; frames are RGB, so there is no alpha to blend
         bar_height = 30
-        bar = Image.new("RGBA", (img.width, bar_height), (0, 0, 0, 180))
-        img.paste(
-            Image.alpha_composite(
-                Image.new("RGBA", bar.size, (0, 0, 0, 0)), bar
-            ).convert("RGB"),
-            (0, img.height - bar_height),
+        draw.rectangle(
+            [(0, img.height - bar_height), (img.width, img.height)],
+            fill=(0, 0, 0),
         )
 
         # Draw text
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except (OSError, IOError):
-            font = ImageFont.load_default()
-
         draw.text(
             (10, img.height - bar_height + 5),
             text,
             fill="white",
-            font=font,
+            font=self._font,
         )
 
-        return np.array(img)
+        return np.asarray(img)
 
     def save(self, path: str, optimize: bool = True) -> str:
         """Save recorded frames as a GIF file.
@@ -236,27 +298,7 @@ class GifRecorder:
 
         output_path = Path(path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Resize frames for optimal GIF size
-        processed_frames = []
-        for frame in self._frames:
-            img = Image.fromarray(frame.image)
-
-            # Downscale to max_width
-            if img.width > self.max_width:
-                ratio = self.max_width / img.width
-                new_size = (self.max_width, int(img.height * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
-
-            processed_frames.append(np.array(img))
-
-        # Write GIF using imageio
-        imageio.mimsave(
-            str(output_path),
-            processed_frames,
-            fps=self.fps,
-            loop=0,
-        )
+        self._write_gif(str(output_path), optimize)
 
         return str(output_path)
 
@@ -266,21 +308,104 @@ class GifRecorder:
         Returns:
             GIF file bytes.
         """
-        if not self._frames:
+        buffer = io.BytesIO()
+        self._write_gif(buffer)
+        return buffer.getvalue()
+
+    def _write_gif(self, target: str | io.BytesIO, optimize: bool = True) -> None:
+        """Quantize recorded frames against one shared palette and write a GIF.
+
+        Shared by :meth:`save` and :meth:`save_to_bytes`, which differ only in
+        the output target.
+
+        Building the palette once replaces the per-frame palette search the
+        GIF writer would otherwise run. Dithering is off: UI content is mostly
+        flat colour, and undithered frames stay identical where the screen did.
+
+        The palette keeps one index free so that, with ``optimize``, Pillow can
+        replace pixels unchanged since the previous frame with transparency;
+        ``disposal=1`` keeps the previous frame visible underneath. The long
+        transparent runs compress far better under LZW.
+
+        Args:
+            target: Output file path or binary buffer.
+            optimize: Whether to encode unchanged pixels as transparency.
+
+        Raises:
+            ValueError: If no frames were recorded.
+        """
+        frames, durations = self._processed_frames()
+        if not frames:
             raise ValueError("No frames recorded")
+        palette = self._global_palette(frames)
+
+        def quantize(frame: np.ndarray) -> Image.Image:
+            return Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE)
+
+        # Frames quantize independently; map() keeps them in order
+        workers = min(len(frames), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            images = list(pool.map(quantize, frames))
+        images[0].save(
+            target,
+            format="GIF",
+            save_all=True,
+            append_images=images[1:],
+            duration=durations,
+            loop=0,
+            optimize=optimize,
+            disposal=1,
+        )
 
-        processed_frames = []
-        for frame in self._frames:
-            img = Image.fromarray(frame.image)
-            if img.width > self.max_width:
-                ratio = self.max_width / img.width
-                new_size = (self.max_width, int(img.height * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
-            processed_frames.append(np.array(img))
+    @staticmethod
+    def _global_palette(frames: list[np.ndarray], samples: int = 8) -> Image.Image:
+        """Build a 255-colour palette from up to ``samples`` evenly spaced frames."""
+        step = max(1, len(frames) // samples)
+        shape = frames[0].shape
+        sampled = [frame for frame in frames[::step][:samples] if frame.shape == shape]
+        reference = Image.fromarray(np.concatenate(sampled, axis=0))
+        # 255 colours leaves a free palette index for the transparency diff
+        return reference.quantize(colors=255, method=Image.Quantize.MEDIANCUT)
 
-        buffer = io.BytesIO()
-        imageio.mimsave(buffer, processed_frames, format="GIF", fps=self.fps, loop=0)
-        return buffer.getvalue()
+    def _processed_frames(self) -> tuple[list[np.ndarray], list[int]]:
+        """Downscale frames for the GIF, merging runs of identical frames.
+
+        An idle screen produces long runs of identical captures. The record loop
+        already folds these into ``repeats``; runs it could not see (e.g. after
+        add_bounding_box edits) are merged here. Each run is encoded once and
+        shown for the combined duration.
+
+        Returns:
+            Tuple of (frames, per-frame display durations in milliseconds).
+        """
+        frame_ms = 1000 / self.fps
+        frames: list[np.ndarray] = []
+        durations: list[float] = []
+        previous: Optional[np.ndarray] = None
+
+        # Snapshot, since the encoder thread may still be appending
+        with self._lock:
+            recorded = list(self._frames)
+
+        for frame in recorded:
+            if previous is not None and np.array_equal(frame.image, previous):
+                durations[-1] += frame_ms * frame.repeats
+                continue
+            previous = frame.image
+
+            frames.append(self._downscale(frame.image))
+            durations.append(frame_ms * frame.repeats)
+
+        return frames, [round(d) for d in durations]
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale a single frame to max_width, leaving smaller frames untouched."""
+        height, width = frame.shape[:2]
+        if width <= self.max_width:
+            return frame
+        new_size = (self.max_width, int(height * self.max_width / width))
+        img = Image.fromarray(frame).resize(new_size, self.resample, reducing_gap=2.0)
+        return np.asarray(img)
 
     def __enter__(self) -> "GifRecorder":
         self.start()
@@ -7,23 +7,55 @@ cross-platform screenshot capture with minimal latency.
 
 from __future__ import annotations
 
-import base64
+import binascii
+import hashlib
 import io
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import mss
 import numpy as np
 from PIL import Image
 
 from agenticos.utils.exceptions import ScreenCaptureError
 
+if TYPE_CHECKING:
+    import mss
+
+# zlib level for encoded PNGs: ~2x faster than Pillow's default 6 for ~10% more bytes
+_PNG_COMPRESS_LEVEL = 3
+
+try:
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:  # optional speedup
+
+    def _b64encode(data: bytes | memoryview) -> str:
+        # base64 output is pure ASCII, so decode via the ASCII fast path
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def _bgra_to_rgb(raw: mss.screenshot.ScreenShot) -> np.ndarray:
+    """Convert an mss BGRA grab to a read-only (H, W, 3) RGB array.
+
+    Copying one channel plane at a time gives NumPy a plain strided loop it
+    vectorises; copying the reversed 3-channel view in one go is ~4x slower.
+    """
+    width, height = raw.size
+    bgra = np.frombuffer(raw.bgra, dtype=np.uint8).reshape(height, width, 4)
+    rgb = np.empty((height, width, 3), dtype=np.uint8)
+    for channel in range(3):
+        rgb[..., channel] = bgra[..., 2 - channel]
+    rgb.flags.writeable = False
+    return rgb
+
 
 @dataclass
 class Screenshot:
     """A captured screenshot with metadata.
 
+    Encodings and arrays derived from ``image`` are cached, so the image must
+    not be modified in place; assign a new image instead, which drops them.
+
     Attributes:
         image: PIL Image of the screenshot.
         width: Width in pixels.
@@ -40,6 +72,18 @@ class Screenshot:
     monitor_index: int
     capture_time_ms: float
     _numpy_cache: Optional[np.ndarray] = field(default=None, repr=False)
+    _view_cache: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _b64_cache: dict[tuple[str, int, int], str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # Caches hold data derived from the old image; skipped during __init__
+        if name == "image" and "_b64_cache" in self.__dict__:
+            self._numpy_cache = None
+            self._view_cache = None
+            self._b64_cache = {}
 
     def to_numpy(self) -> np.ndarray:
         """Convert to numpy array (RGB, HWC format).
@@ -51,7 +95,19 @@ class Screenshot:
             self._numpy_cache = np.array(self.image)
         return self._numpy_cache
 
-    def to_base64(self, format: str = "PNG", max_dimension: int = 1568) -> str:
+    def view_numpy(self) -> np.ndarray:
+        """Read-only RGB array of the image, without the copy ``to_numpy`` makes.
+
+        Returns:
+            Read-only numpy array of shape (H, W, 3), cached on first use.
+        """
+        if self._view_cache is None:
+            self._view_cache = np.asarray(self.image)
+        return self._view_cache
+
+    def to_base64(
+        self, format: str = "PNG", max_dimension: int = 1568, quality: int = 85
+    ) -> str:
         """Encode screenshot as base64 string for LLM consumption.
 
         Optionally downscales to fit within max_dimension (Claude's recommended
@@ -60,33 +116,111 @@ class Screenshot:
         Args:
             format: Image format (PNG or JPEG).
             max_dimension: Maximum pixel dimension on longest edge.
+            quality: JPEG quality (1-95); ignored for PNG.
 
         Returns:
-            Base64-encoded image string.
+            Base64-encoded image string, memoized per encoding settings.
         """
+        key = (format.upper(), max_dimension, quality)
+        cached = self._b64_cache.get(key)
+        if cached is None:
+            buffer = self._encode(format, max_dimension, quality)
+            # Encode straight from the BytesIO buffer instead of a getvalue() copy
+            with buffer.getbuffer() as view:
+                cached = self._b64_cache[key] = _b64encode(view)
+        return cached
+
+    def _encode(self, format: str, max_dimension: Optional[int], quality: int) -> io.BytesIO:
+        """Downscale (if needed) and encode the image into a buffer."""
         img = self.image
         # Downscale if needed (Claude Computer Use recommends ≤1568px longest edge)
-        if max(img.width, img.height) > max_dimension:
+        if max_dimension is not None and max(img.width, img.height) > max_dimension:
             ratio = max_dimension / max(img.width, img.height)
             new_size = (int(img.width * ratio), int(img.height * ratio))
-            img = img.resize(new_size, Image.LANCZOS)
+            # reducing_gap box-reduces by an integer factor first, so LANCZOS
+            # only runs over a frame at most 2x the target size
+            img = img.resize(new_size, Image.LANCZOS, reducing_gap=2.0)
 
         buffer = io.BytesIO()
-        img.save(buffer, format=format)
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+        if format.upper() in ("JPEG", "JPG"):
+            img.save(buffer, format="JPEG", quality=quality)
+        elif format.upper() == "PNG":
+            img.save(buffer, format="PNG", compress_level=_PNG_COMPRESS_LEVEL)
+        else:
+            img.save(buffer, format=format)
+        return buffer
 
-    def to_bytes(self, format: str = "PNG") -> bytes:
+    def crop(self, box: tuple[int, int, int, int]) -> Screenshot:
+        """Cut out a region as its own Screenshot.
+
+        Args:
+            box: (left, top, right, bottom) in pixels.
+
+        Returns:
+            Screenshot of the region, sharing this capture's metadata.
+        """
+        img = self.image.crop(box)
+        return Screenshot(
+            image=img,
+            width=img.width,
+            height=img.height,
+            timestamp=self.timestamp,
+            monitor_index=self.monitor_index,
+            capture_time_ms=self.capture_time_ms,
+        )
+
+    def tile_digests(self, tile_size: int = 64) -> dict[tuple[int, int], bytes]:
+        """Hash the image in square tiles for change detection.
+
+        Args:
+            tile_size: Tile edge in pixels (edge tiles may be smaller).
+
+        Returns:
+            Map of each tile's (left, top) to an 8-byte digest of its pixels.
+        """
+        arr = self.view_numpy()
+        height, width = arr.shape[:2]
+        return {
+            (x, y): hashlib.blake2b(
+                arr[y : y + tile_size, x : x + tile_size].tobytes(), digest_size=8
+            ).digest()
+            for y in range(0, height, tile_size)
+            for x in range(0, width, tile_size)
+        }
+
+    def to_bytes(
+        self, format: str = "PNG", max_dimension: Optional[int] = None, quality: int = 85
+    ) -> bytes:
         """Encode screenshot as bytes.
 
         Args:
             format: Image format (PNG or JPEG).
+            max_dimension: Optional maximum pixel dimension on longest edge.
+            quality: JPEG quality (1-95); ignored for PNG.
 
         Returns:
             Image bytes.
         """
-        buffer = io.BytesIO()
-        self.image.save(buffer, format=format)
-        return buffer.getvalue()
+        return self._encode(format, max_dimension, quality).getvalue()
+
+    def to_memoryview(
+        self, format: str = "PNG", max_dimension: Optional[int] = None, quality: int = 85
+    ) -> memoryview:
+        """Encode screenshot and return a zero-copy view of the encoded data.
+
+        Same as :meth:`to_bytes` but skips the final copy out of the encode
+        buffer, for callers that only read the data once (e.g. to copy it
+        into shared memory or a socket).
+
+        Args:
+            format: Image format (PNG or JPEG).
+            max_dimension: Optional maximum pixel dimension on longest edge.
+            quality: JPEG quality (1-95); ignored for PNG.
+
+        Returns:
+            Read-only view over the encoded image.
+        """
+        return self._encode(format, max_dimension, quality).getbuffer().toreadonly()
 
     def save(self, path: str, format: str = "PNG") -> None:
         """Save screenshot to file.
@@ -125,6 +259,8 @@ class ScreenCapture:
     def _get_sct(self) -> mss.mss:
         """Get or create mss instance (lazy init)."""
         if self._sct is None:
+            import mss  # deferred: only capture needs it, not Screenshot users
+
             self._sct = mss.mss()
         return self._sct
 
@@ -174,6 +310,33 @@ class ScreenCapture:
         except Exception as e:
             raise ScreenCaptureError(f"Failed to capture screen: {e}") from e
 
+    def grab_numpy(self, region: Optional[dict] = None) -> tuple[np.ndarray, float]:
+        """Capture a frame as an RGB array, skipping the Screenshot wrapper.
+
+        Unscaled captures never go through Pillow; used by the GIF recorder.
+
+        Args:
+            region: Optional capture region, as for :meth:`grab`.
+
+        Returns:
+            Tuple of (read-only (H, W, 3) RGB array, capture time in milliseconds).
+
+        Raises:
+            ScreenCaptureError: If capture fails.
+        """
+        if self.scale != 1.0:
+            screenshot = self.grab(region)
+            return screenshot.view_numpy(), screenshot.capture_time_ms
+
+        try:
+            sct = self._get_sct()
+            start = time.perf_counter()
+            raw = sct.grab(region or sct.monitors[self.monitor])
+            rgb = _bgra_to_rgb(raw)
+            return rgb, (time.perf_counter() - start) * 1000
+        except Exception as e:
+            raise ScreenCaptureError(f"Failed to capture screen: {e}") from e
+
     def get_screen_size(self) -> tuple[int, int]:
         """Get the size of the configured monitor.
 
@@ -1,5 +1,5 @@
 """Shared utilities for AgenticOS."""
 
-from agenticos.utils.config import AgenticOSConfig, get_config
+from agenticos.utils.config import AgenticOSConfig, get_config, reset_config
 
-__all__ = ["AgenticOSConfig", "get_config"]
+__all__ = ["AgenticOSConfig", "get_config", "reset_config"]
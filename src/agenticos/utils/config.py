@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from enum import Enum
 from typing import Optional
@@ -149,25 +150,37 @@ class AgenticOSConfig(BaseSettings):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> AgenticOSConfig:
     """Load and return the AgenticOS configuration.
 
+    The environment and ``.env`` are read once; later calls return the same
+    shared instance, so treat it as read-only and override fields on a
+    ``model_copy()``. Use :func:`reset_config` to pick up changes.
+
     Returns:
         AgenticOSConfig with values from env vars and defaults.
     """
     return AgenticOSConfig()
 
 
+def reset_config() -> None:
+    """Drop the cached configuration so the next get_config() reloads it."""
+    get_config.cache_clear()
+
+
 # Convenience: resolve API key from multiple sources
-def resolve_api_key(config: AgenticOSConfig) -> Optional[str]:
+def resolve_api_key(config: Optional[AgenticOSConfig] = None) -> Optional[str]:
     """Resolve the API key from config or well-known environment variables.
 
     Args:
-        config: The AgenticOS configuration.
+        config: The AgenticOS configuration, or None to use get_config().
 
     Returns:
         The API key string, or None if not found.
     """
+    if config is None:
+        config = get_config()
     if config.llm_api_key:
         return config.llm_api_key
 
@@ -19,6 +19,10 @@ class ActionBlockedError(ActionError):
     """Action was blocked by safety gate."""
 
 
+class PartialInputError(ActionError):
+    """Only part of an input sequence was injected; retrying would repeat it."""
+
+
 class LLMError(AgenticOSError):
     """Error communicating with the LLM."""
 
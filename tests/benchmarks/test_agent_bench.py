@@ -0,0 +1,15 @@
+"""Benchmarks for agent bookkeeping (``pytest --benchmark-enable --benchmark-only``)."""
+
+import pytest
+
+from agenticos.agent.planner import PlanStep, TaskPlan
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_task_plan_progress(benchmark):
+    plan = TaskPlan(
+        original_task="Long task",
+        steps=[PlanStep(i, f"Step {i}", completed=i < 250) for i in range(500)],
+    )
+    assert benchmark(lambda: plan.progress) == pytest.approx(0.5)
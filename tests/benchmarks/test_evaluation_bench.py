@@ -0,0 +1,25 @@
+"""Benchmarks for metric aggregation (``pytest --benchmark-enable --benchmark-only``)."""
+
+import pytest
+
+from agenticos.evaluation.metrics import BenchmarkMetrics, TaskResult
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_summary(benchmark):
+    results = [
+        TaskResult(
+            f"t{i}",
+            f"Task {i}",
+            category=("basic", "intermediate", "advanced")[i % 3],
+            success=i % 4 != 0,
+            steps_taken=i % 9 + 1,
+            optimal_steps=3,
+            elapsed_seconds=i * 0.5,
+        )
+        for i in range(1000)
+    ]
+    metrics = BenchmarkMetrics.from_records(results, benchmark_name="bench")
+    summary = benchmark(metrics.summary)
+    assert "bench" in summary
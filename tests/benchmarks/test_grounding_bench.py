@@ -0,0 +1,63 @@
+"""Benchmarks for UIA grounding (``pytest --benchmark-enable --benchmark-only``)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agenticos.grounding.accessibility import UIAGrounder
+
+pytestmark = pytest.mark.benchmark
+
+
+class _Node:
+    """A cached UIA Button, cheap enough that the grounder's own work dominates."""
+
+    CachedControlType = 50000
+    CachedAutomationId = ""
+    CachedClassName = "Button"
+    CachedIsEnabled = True
+    CachedIsOffscreen = False
+    CachedNativeWindowHandle = 0
+    CachedBoundingRectangle = SimpleNamespace(left=10, top=10, right=90, bottom=40)
+
+    def __init__(self, name, children=()):
+        self.CachedName = name
+        self._children = SimpleNamespace(Length=len(children), GetElement=children.__getitem__)
+
+    def GetCachedPropertyValue(self, property_id):  # noqa: N802
+        return ""
+
+    def GetCachedChildren(self):  # noqa: N802
+        return self._children
+
+
+def _window(count):
+    root = _Node("window", [_Node(f"Item {i}") for i in range(count)])
+    root.CachedControlType = 50033  # Pane
+    raw = SimpleNamespace(BuildUpdatedCache=lambda request: root)
+    return SimpleNamespace(
+        handle=id(root), is_visible=lambda: True, element_info=SimpleNamespace(element=raw)
+    )
+
+
+def test_detect_desktop(benchmark):
+    windows = [_window(80) for _ in range(3)]
+    by_handle = {w.handle: w for w in windows}
+    desktop = MagicMock()
+    desktop.return_value.windows.return_value = windows
+    modules = {
+        "pywinauto": MagicMock(Desktop=desktop),
+        "pywinauto.application": MagicMock(),
+        "comtypes": MagicMock(),
+    }
+    grounder = UIAGrounder()
+    grounder._uia_client = MagicMock()
+
+    with (
+        patch.dict("sys.modules", modules),
+        patch.object(grounder, "_window_from_handle", by_handle.__getitem__),
+        patch.object(grounder, "_build_cache_request", object),
+    ):
+        elements = benchmark(grounder.detect)
+    assert len(elements) == 240
@@ -0,0 +1,39 @@
+"""Benchmarks for the observation hot paths (``pytest --benchmark-enable --benchmark-only``)."""
+
+import pytest
+
+from agenticos.agent.base import Observation
+from agenticos.grounding.accessibility import UIElement
+from agenticos.observation.screenshot import Screenshot
+
+pytestmark = pytest.mark.benchmark
+
+
+def _fresh(screenshot):
+    """A copy of ``screenshot`` with empty caches, so each round does the work."""
+    return Screenshot(
+        image=screenshot.image,
+        width=screenshot.width,
+        height=screenshot.height,
+        timestamp=screenshot.timestamp,
+        monitor_index=screenshot.monitor_index,
+        capture_time_ms=screenshot.capture_time_ms,
+    )
+
+
+def test_to_numpy(benchmark, tiny_screenshot):
+    benchmark(lambda: _fresh(tiny_screenshot).to_numpy())
+
+
+def test_to_base64(benchmark, tiny_screenshot):
+    benchmark(lambda: _fresh(tiny_screenshot).to_base64())
+
+
+def test_elements_summary(benchmark, tiny_screenshot):
+    elements = [
+        UIElement(name=f"Item {i}", control_type="Button", idx=i, center=(i, i))
+        for i in range(200)
+    ]
+    obs = Observation(screenshot=tiny_screenshot, ui_elements=elements, active_window="Test")
+    summary = benchmark(obs.elements_summary)
+    assert summary.count("\n") == 201
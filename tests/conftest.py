@@ -5,16 +5,22 @@ import pytest
 from agenticos.utils.config import AgenticOSConfig, GroundingMode
 
 
-@pytest.fixture
-def config():
-    """A default test config."""
+@pytest.fixture(scope="session")
+def session_config():
+    """The default test config, validated once per session; do not modify."""
     return AgenticOSConfig(
         max_steps=5,
         confirm_actions=False,
-        grounding_mode=GroundingMode.UIA_ONLY,
+        grounding_mode=GroundingMode.UIA,
     )
 
 
+@pytest.fixture
+def config(session_config):
+    """A default test config, copied per test so changes stay local."""
+    return session_config.model_copy(deep=True)
+
+
 @pytest.fixture
 def mock_screenshot():
     """A mock screenshot for testing."""
@@ -26,3 +32,20 @@ def mock_screenshot():
     mock.height = 1080
     mock.to_base64.return_value = "base64data"
     return mock
+
+
+@pytest.fixture
+def tiny_screenshot():
+    """A real 64x64 screenshot, cheap enough for unit tests and benchmarks."""
+    from PIL import Image
+
+    from agenticos.observation.screenshot import Screenshot
+
+    return Screenshot(
+        image=Image.new("RGB", (64, 64)),
+        width=64,
+        height=64,
+        timestamp=0.0,
+        monitor_index=0,
+        capture_time_ms=0.0,
+    )
@@ -6,7 +6,7 @@ import pytest
 
 from agenticos.actions.compositor import Action, ActionCompositor, ActionResult, ActionType
 from agenticos.actions.shell import ShellExecutor, ShellResult
-from agenticos.utils.exceptions import ActionBlockedError
+from agenticos.utils.exceptions import ActionBlockedError, ActionError, PartialInputError
 
 
 class TestAction:
@@ -56,6 +56,22 @@ class TestShellExecutor:
         with pytest.raises(ActionBlockedError):
             shell.run("SHUTDOWN /s")
 
+    def test_blocked_command_reports_pattern(self):
+        shell = ShellExecutor(blocked_commands=["format", "Reg Delete"])
+        with pytest.raises(ActionBlockedError, match="'Reg Delete'"):
+            shell.run("reg delete HKCU\\Software\\Foo")
+
+    def test_blocklist_edited_in_place_is_enforced(self):
+        shell = ShellExecutor(blocked_commands=["shutdown"])
+        shell._check_blocked("format c:")
+        shell.blocked_commands.append("format")
+        with pytest.raises(ActionBlockedError):
+            shell._check_blocked("format c:")
+
+    def test_empty_blocklist_allows_everything(self):
+        shell = ShellExecutor(blocked_commands=[])
+        shell._check_blocked("format c:")
+
     def test_run_echo(self):
         """Test running a simple echo command."""
         shell = ShellExecutor(blocked_commands=[])
@@ -70,6 +86,41 @@ class TestShellExecutor:
         assert result.success
         assert "test123" in result.stdout
 
+    @patch("agenticos.actions.shell.subprocess.Popen")
+    def test_open_application_direct(self, mock_popen):
+        """Known built-ins are spawned directly, not via Start-Process."""
+        mock_popen.return_value.poll.return_value = None
+        shell = ShellExecutor(blocked_commands=[])
+        with patch.object(shell, "run") as mock_run:
+            result = shell.open_application("Notepad")
+        assert result.success
+        assert mock_popen.call_args[0][0] == ["notepad.exe"]
+        mock_run.assert_not_called()
+
+    @patch("agenticos.actions.shell.subprocess.Popen")
+    def test_open_application_direct_checks_blocklist(self, mock_popen):
+        shell = ShellExecutor(blocked_commands=["notepad"])
+        with pytest.raises(ActionBlockedError):
+            shell.open_application("notepad")
+        mock_popen.assert_not_called()
+
+    @patch("agenticos.actions.shell.subprocess.Popen")
+    def test_open_application_console_uses_start_process(self, mock_popen):
+        shell = ShellExecutor(blocked_commands=[])
+        with patch.object(shell, "run") as mock_run:
+            shell.open_application("cmd")
+        mock_popen.assert_not_called()
+        mock_run.assert_called_once_with("Start-Process 'cmd'")
+
+    @patch("agenticos.actions.shell.subprocess.Popen", side_effect=OSError)
+    def test_open_application_fallback(self, mock_popen):
+        shell = ShellExecutor(blocked_commands=[])
+        with patch.object(shell, "run") as mock_run:
+            shell.open_application("calc")
+            shell.open_application("winword")
+        assert mock_run.call_count == 2
+        mock_run.assert_called_with("Start-Process 'winword'")
+
     def test_shell_result_properties(self):
         result = ShellResult(
             command="test",
@@ -93,6 +144,42 @@ class TestShellExecutor:
         assert "error msg" in result.output
 
 
+class TestKeyboardExecutor:
+    """Tests for the KeyboardExecutor."""
+
+    def test_send_text_single_sendinput(self):
+        from agenticos.actions import keyboard
+
+        windll = MagicMock()
+        windll.user32.SendInput.side_effect = lambda n, inputs, size: n
+        with patch.object(keyboard.ctypes, "windll", windll, create=True):
+            keyboard.KeyboardExecutor().send_text("hi")
+
+        n, inputs, _ = windll.user32.SendInput.call_args[0]
+        assert n == 4
+        assert [i.u.ki.wScan for i in inputs] == [ord("h"), ord("h"), ord("i"), ord("i")]
+        assert inputs[1].u.ki.dwFlags & keyboard._KEYEVENTF_KEYUP
+
+    def test_send_text_nothing_injected_raises(self):
+        from agenticos.actions import keyboard
+
+        windll = MagicMock()
+        windll.user32.SendInput.return_value = 0
+        with patch.object(keyboard.ctypes, "windll", windll, create=True):
+            with pytest.raises(ActionError) as exc_info:
+                keyboard.KeyboardExecutor().send_text("x")
+        assert not isinstance(exc_info.value, PartialInputError)
+
+    def test_send_text_partial_injection_raises(self):
+        from agenticos.actions import keyboard
+
+        windll = MagicMock()
+        windll.user32.SendInput.return_value = 3
+        with patch.object(keyboard.ctypes, "windll", windll, create=True):
+            with pytest.raises(PartialInputError):
+                keyboard.KeyboardExecutor().send_text("xy")
+
+
 class TestActionCompositor:
     """Tests for the ActionCompositor."""
 
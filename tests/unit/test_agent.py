@@ -1,7 +1,5 @@
 """Unit tests for agent modules."""
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from agenticos.agent.base import AgentState, AgentStatus, Observation, StepResult
@@ -37,28 +35,28 @@ class TestAgentState:
 class TestObservation:
     """Tests for the Observation data class."""
 
-    def test_observation_with_elements(self):
+    def test_observation_with_elements(self, tiny_screenshot):
         from agenticos.grounding.accessibility import UIElement
 
         elem1 = UIElement(name="OK", control_type="Button", idx=0)
         elem2 = UIElement(name="Name", control_type="Edit", idx=1)
 
         obs = Observation(
-            screenshot=MagicMock(),
+            screenshot=tiny_screenshot,
             ui_elements=[elem1, elem2],
             active_window="Notepad",
         )
         assert obs.active_window == "Notepad"
         assert len(obs.ui_elements) == 2
 
-    def test_elements_summary(self):
+    def test_elements_summary(self, tiny_screenshot):
         from agenticos.grounding.accessibility import UIElement
 
         elem1 = UIElement(name="OK", control_type="Button", idx=0, center=(100, 200))
         elem2 = UIElement(name="Name", control_type="Edit", idx=1, center=(50, 50))
 
         obs = Observation(
-            screenshot=MagicMock(),
+            screenshot=tiny_screenshot,
             ui_elements=[elem1, elem2],
             active_window="Test",
         )
@@ -160,3 +158,34 @@ class TestTaskPlan:
         plan.mark_current_complete()
         assert plan.steps[0].completed is True
         assert plan.steps[1].completed is False
+
+    def test_mark_complete_updates_progress(self):
+        plan = TaskPlan(
+            original_task="Test",
+            steps=[
+                PlanStep(1, "Step 1", expected_state="Done", completed=True),
+                PlanStep(2, "Step 2", expected_state="Done"),
+                PlanStep(3, "Step 3", expected_state="Done"),
+                PlanStep(4, "Step 4", expected_state="Done"),
+            ],
+        )
+        assert plan.progress == pytest.approx(0.25)
+        plan.mark_complete(3)
+        plan.mark_complete(3)
+        assert plan.progress == pytest.approx(0.5)
+        plan.mark_current_complete()
+        plan.mark_current_complete()
+        assert plan.is_complete
+        assert plan.current_step is None
+
+    def test_progress_follows_direct_step_changes(self):
+        plan = TaskPlan(
+            original_task="Test",
+            steps=[PlanStep(1, "Step 1"), PlanStep(2, "Step 2")],
+        )
+        assert plan.progress == 0.0
+        plan.steps[0].completed = True
+        assert plan.progress == pytest.approx(0.5)
+        plan.steps.append(PlanStep(3, "Step 3", completed=True))
+        plan.steps[1].completed = True
+        assert plan.is_complete
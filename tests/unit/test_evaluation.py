@@ -74,6 +74,44 @@ class TestBenchmarkMetrics:
         eff = metrics.mean_step_efficiency
         assert 0.0 < eff <= 1.0
 
+    def test_mean_step_efficiency_value(self):
+        metrics = BenchmarkMetrics(self._sample_results())
+        assert metrics.mean_step_efficiency == pytest.approx((2 / 3 + 3 / 5 + 4 / 7) / 3)
+
+    def test_metrics_follow_added_results(self):
+        metrics = BenchmarkMetrics(self._sample_results())
+        assert metrics.success_rate == pytest.approx(0.75)
+        metrics.add_result(TaskResult(task_id="t5", task_name="Task 5", cost_usd=0.04))
+        assert metrics.success_rate == pytest.approx(0.6)
+        assert metrics.total_cost == pytest.approx(0.15)
+
+    def test_metrics_follow_reassigned_results(self):
+        metrics = BenchmarkMetrics(self._sample_results())
+        assert metrics.success_rate == pytest.approx(0.75)
+        metrics.results = [TaskResult(task_id=str(i), task_name="t") for i in range(4)]
+        assert metrics.success_rate == 0.0
+
+    def test_metrics_follow_edited_results(self):
+        metrics = BenchmarkMetrics([TaskResult(task_id="t", task_name="t")])
+        assert metrics.success_rate == 0.0
+        metrics.results[0].success = True
+        assert metrics.success_rate == pytest.approx(1.0)
+        metrics.results[0] = TaskResult(task_id="t", task_name="t", cost_usd=0.5)
+        assert metrics.success_rate == 0.0
+        assert metrics.total_cost == pytest.approx(0.5)
+
+    def test_from_records(self):
+        metrics = BenchmarkMetrics.from_records(iter(self._sample_results()), model_name="m")
+        assert metrics.model_name == "m"
+        assert len(metrics.results) == 4
+        assert metrics.total_cost == pytest.approx(0.11)
+
+    def test_empty_metrics(self):
+        metrics = BenchmarkMetrics()
+        assert metrics.success_rate == 0.0
+        assert metrics.mean_step_efficiency == 0.0
+        assert metrics.total_cost == 0.0
+
     def test_mean_time(self):
         metrics = BenchmarkMetrics(self._sample_results())
         assert metrics.mean_time > 0
@@ -151,7 +189,36 @@ class TestBenchmarkSuite:
         advanced = BenchmarkSuite.builtin_advanced()
         assert len(all_suite.tasks) == len(basic.tasks) + len(intermediate.tasks) + len(advanced.tasks)
 
+    def test_builtin_suites_are_cached_copies(self):
+        first = BenchmarkSuite.builtin_all()
+        first.tasks.clear()
+        second = BenchmarkSuite.builtin_all()
+        assert len(second.tasks) == 30
+        assert second.tasks[0] is BenchmarkSuite.builtin_basic().tasks[0]
+
     def test_unique_task_ids(self):
         all_suite = BenchmarkSuite.builtin_all()
         ids = [t.task_id for t in all_suite.tasks]
         assert len(ids) == len(set(ids)), "Task IDs must be unique"
+
+    def test_count_by_category(self):
+        all_suite = BenchmarkSuite.builtin_all()
+        counts = all_suite.count_by_category()
+        assert counts == {
+            c: len(all_suite.filter_by_category(c))
+            for c in ("basic", "intermediate", "advanced")
+        }
+
+    def test_count_by_domain(self):
+        suite = BenchmarkSuite.builtin_basic()
+        counts = suite.count_by_domain()
+        assert sum(counts.values()) == len(suite.tasks)
+        assert counts["notepad"] == len(suite.filter_by_domain("notepad"))
+
+    def test_json_round_trip(self):
+        suite = BenchmarkSuite.builtin_basic()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = suite.save_json(str(Path(tmpdir) / "suite.json"))
+            loaded = BenchmarkSuite.from_json(path)
+        assert loaded.name == suite.name
+        assert [t.to_dict() for t in loaded.tasks] == [t.to_dict() for t in suite.tasks]
@@ -1,5 +1,6 @@
 """Unit tests for grounding modules."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,6 +8,23 @@ import pytest
 from agenticos.grounding.accessibility import UIAGrounder, UIElement
 
 
+def _cached_node(name, children=()):
+    """A fake IUIAutomationElement built from a CacheRequest."""
+    n = MagicMock()
+    n.CachedControlType = 50000
+    n.CachedName = name
+    n.CachedAutomationId = ""
+    n.CachedClassName = ""
+    n.CachedIsEnabled = True
+    n.CachedIsOffscreen = False
+    n.CachedNativeWindowHandle = 0
+    n.CachedBoundingRectangle = MagicMock(left=0, top=0, right=20, bottom=20)
+    array = MagicMock(Length=len(children))
+    array.GetElement.side_effect = list(children).__getitem__
+    n.GetCachedChildren.return_value = array
+    return n
+
+
 class TestUIElement:
     """Tests for the UIElement data class."""
 
@@ -43,6 +61,13 @@ class TestUIElement:
         assert "bbox" in d
         assert d["idx"] == 3
 
+    def test_to_dict_reflects_later_changes(self):
+        elem = UIElement(name="Save", control_type="Button", idx=3)
+        elem.to_dict()["name"] = "edited"
+        elem.idx = 4
+        assert elem.to_dict()["name"] == "Save"
+        assert elem.to_dict()["idx"] == 4
+
     def test_description(self):
         elem = UIElement(
             name="File",
@@ -72,6 +97,12 @@ class TestUIElement:
         )
         assert elem.center == (140, 220)
 
+    def test_slotted_no_instance_dict(self):
+        elem = UIElement(name="OK", control_type="Button")
+        assert not hasattr(elem, "__dict__")
+        with pytest.raises(AttributeError):
+            elem.tooltip = "typo"  # type: ignore[attr-defined]
+
 
 class TestUIAGrounder:
     """Tests for the UIAGrounder."""
@@ -83,3 +114,385 @@ class TestUIAGrounder:
     def test_init_custom_params(self):
         grounder = UIAGrounder(max_depth=5, interactive_only=False, min_size=10)
         assert grounder.max_depth == 5
+
+    def test_walk_tree_reads_cached_subtree(self):
+        node = _cached_node
+        leaf_a, leaf_b = node("a"), node("b")
+        root = node("root", [leaf_a, leaf_b])
+        root.CachedControlType = 50021  # ToolBar
+        window = MagicMock()
+        window.element_info.element.BuildUpdatedCache.return_value = root
+
+        grounder = UIAGrounder()
+        grounder._local.cache_request = object()
+        results: list[UIElement] = []
+        grounder._walk_tree(window, results, depth=0)
+
+        assert [e.name for e in results] == ["root", "a", "b"]
+        assert results[0].children_count == 2
+        assert [e.depth for e in results] == [0, 1, 1]
+        window.element_info.element.BuildUpdatedCache.assert_called_once()
+        for n in (root, leaf_a, leaf_b):
+            assert n.GetCachedChildren.call_count == 1
+
+    def test_interactive_scan_keeps_depth_and_max_depth(self):
+        def pane(name, children):
+            n = _cached_node(name, children)
+            n.CachedControlType = 50033  # Pane, not interactive
+            return n
+
+        root = pane("root", [_cached_node("top"), pane("group", [_cached_node("deep")])])
+        window = MagicMock()
+        window.element_info.element.BuildUpdatedCache.return_value = root
+
+        grounder = UIAGrounder()
+        grounder._local.cache_request = object()
+        results: list[UIElement] = []
+        grounder._scan(window, results)
+        assert [(e.name, e.depth) for e in results] == [("top", 1), ("deep", 2)]
+
+        shallow = UIAGrounder(max_depth=1)
+        shallow._local.cache_request = object()
+        results = []
+        shallow._scan(window, results)
+        assert [e.name for e in results] == ["top"]
+
+    def test_watched_detect_reuses_snapshot_until_change(self):
+        desktop = MagicMock()
+        desktop.return_value.windows.return_value = []
+        fake_pywinauto = MagicMock(Desktop=desktop)
+        modules = {"pywinauto": fake_pywinauto, "pywinauto.application": MagicMock()}
+
+        grounder = UIAGrounder()
+        grounder._watch_handler = object()  # as if watch() had subscribed
+        with patch.dict("sys.modules", modules):
+            assert grounder.detect() == []
+            assert grounder.detect() == []
+            assert desktop.call_count == 1, "unchanged UI should not be re-scanned"
+
+            grounder._changed.set()  # what the UIA event handler does
+            grounder.detect()
+            assert desktop.call_count == 2
+
+    def test_desktop_scan_merges_windows_in_order(self):
+        windows = [MagicMock(name=f"win{i}", handle=i) for i in range(3)]
+        desktop = MagicMock()
+        desktop.return_value.windows.return_value = windows
+        modules = {
+            "pywinauto": MagicMock(Desktop=desktop),
+            "pywinauto.application": MagicMock(),
+            "comtypes": MagicMock(),
+        }
+
+        def fake_scan(window, results, **_):
+            results.append(UIElement(name=str(windows.index(window)), control_type="Button"))
+
+        grounder = UIAGrounder()
+        with (
+            patch.dict("sys.modules", modules),
+            patch.object(grounder, "_window_from_handle", windows.__getitem__),
+            patch.object(grounder, "_scan", fake_scan),
+        ):
+            elements = grounder.detect()
+
+        assert [e.name for e in elements] == ["0", "1", "2"]
+        assert [e.idx for e in elements] == [0, 1, 2]
+
+    def test_desktop_scan_caps_elements_in_window_order(self):
+        def window(i):
+            root = _cached_node(f"root{i}", [_cached_node(f"{i}.{j}") for j in range(200)])
+            root.CachedControlType = 50033  # Pane, not interactive
+            win = MagicMock(handle=i)
+            win.element_info.element.BuildUpdatedCache.return_value = root
+            return win
+
+        windows = [window(i) for i in range(3)]
+        desktop = MagicMock()
+        desktop.return_value.windows.return_value = windows
+        modules = {
+            "pywinauto": MagicMock(Desktop=desktop),
+            "pywinauto.application": MagicMock(),
+            "comtypes": MagicMock(),
+        }
+
+        grounder = UIAGrounder()
+        with (
+            patch.dict("sys.modules", modules),
+            patch.object(grounder, "_window_from_handle", windows.__getitem__),
+            patch.object(grounder, "_build_cache_request", object),
+        ):
+            elements = grounder.detect()
+
+        # Filled in window order, as a sequential scan would
+        assert [e.name for e in elements[:200]] == [f"0.{j}" for j in range(200)]
+        assert [e.name for e in elements[200:]] == [f"1.{j}" for j in range(100)]
+
+    def test_interactive_type_ids_match_names(self):
+        assert len(UIAGrounder.INTERACTIVE_TYPE_IDS) == len(UIAGrounder.INTERACTIVE_TYPES)
+        assert 50000 in UIAGrounder.INTERACTIVE_TYPE_IDS  # Button
+        assert 50004 in UIAGrounder.INTERACTIVE_TYPE_IDS  # Edit
+        assert 50033 not in UIAGrounder.INTERACTIVE_TYPE_IDS  # Pane
+
+    def test_element_tree_text_indents_by_depth(self):
+        elements = [
+            UIElement(name="File", control_type="MenuItem", depth=0, idx=0),
+            UIElement(name="Open", control_type="MenuItem", depth=2, idx=1),
+            UIElement(name="Deep", control_type="Button", depth=9, idx=2),
+        ]
+        grounder = UIAGrounder()
+        with patch.object(grounder, "detect", return_value=elements):
+            lines = grounder.get_element_tree_text().splitlines()
+        assert lines[0] == "Detected 3 interactive UI elements:"
+        assert lines[1].startswith("[0]")
+        assert lines[2].startswith("    [1]")
+        assert lines[3].startswith("        [2]")
+
+    def test_value_read_from_cached_value_pattern(self):
+        edit = _cached_node("Search")
+        edit.CachedControlType = 50004  # Edit
+        edit.GetCachedPropertyValue.return_value = "hello"
+        same = _cached_node("Go")
+        same.GetCachedPropertyValue.return_value = "Go"
+        root = _cached_node("root", [edit, same])
+        window = MagicMock()
+        window.element_info.element.BuildUpdatedCache.return_value = root
+
+        grounder = UIAGrounder()
+        grounder._local.cache_request = object()
+        results: list[UIElement] = []
+        grounder._walk_tree(window, results, depth=0)
+
+        values = {e.name: e.value for e in results}
+        assert values["Search"] == "hello"
+        assert values["Go"] is None, "value equal to name is dropped"
+        assert values["root"] is None
+
+    def test_leaf_controls_skip_child_count(self):
+        button = _cached_node("OK", [_cached_node("label")])
+        toolbar = _cached_node("bar", [_cached_node("x"), _cached_node("y")])
+        toolbar.CachedControlType = 50021  # ToolBar
+        root = _cached_node("root", [button, toolbar])
+        root.CachedControlType = 50033  # Pane, not interactive
+        window = MagicMock()
+        window.element_info.element.BuildUpdatedCache.return_value = root
+
+        grounder = UIAGrounder(max_depth=1)
+        grounder._local.cache_request = object()
+        results: list[UIElement] = []
+        grounder._scan(window, results)
+
+        assert [(e.name, e.children_count) for e in results] == [("OK", 0), ("bar", 2)]
+        button.GetCachedChildren.assert_not_called()
+
+
+class TestOCRGrounder:
+    """Tests for the OCRGrounder."""
+
+    def _grounder(self, result):
+        from agenticos.grounding.ocr import OCRGrounder
+
+        grounder = OCRGrounder(confidence_threshold=0.5)
+        grounder._ocr_engine = MagicMock(return_value=(result, None))
+        return grounder
+
+    def _screenshot(self, width=800, height=600):
+        return MagicMock(width=width, height=height)
+
+    def test_detect_reduces_polygons_and_filters_confidence(self):
+        result = [
+            [[[10, 20], [50, 20], [50, 40], [10, 40]], "File", 0.9],
+            [[[0, 0], [5, 0], [5, 5], [0, 5]], "noise", 0.1],
+            [[[100.7, 200.2], [161.9, 201], [161, 231.5], [100, 230]], "Save", 0.8],
+        ]
+        screenshot = self._screenshot()
+        elements = self._grounder(result).detect(screenshot)
+
+        assert [e.name for e in elements] == ["File", "Save"]
+        assert elements[0].bbox == (10, 20, 50, 40)
+        assert elements[0].center == (30, 30)
+        assert elements[1].bbox == (100, 200, 161, 231)
+        assert elements[1].idx == 2
+
+    def test_detect_empty_result(self):
+        assert self._grounder(None).detect(self._screenshot()) == []
+
+    def test_detect_text_at_picks_nearest_and_reuses_ocr(self):
+        result = [
+            [[[0, 0], [40, 0], [40, 20], [0, 20]], "File", 0.9],
+            [[[60, 0], [100, 0], [100, 20], [60, 20]], "Edit", 0.9],
+        ]
+        grounder = self._grounder(result)
+        screenshot = self._screenshot()
+
+        assert grounder.detect_text_at(screenshot, 75, 12) == "Edit"
+        assert grounder.detect_text_at(screenshot, 15, 8) == "File"
+        assert grounder.detect_text_at(screenshot, 500, 500) is None
+        assert grounder._ocr_engine.call_count == 1
+
+    def test_detect_text_at_reruns_ocr_for_replaced_image(self):
+        import gc
+
+        from PIL import Image
+
+        from agenticos.observation.screenshot import Screenshot
+
+        result = [[[[0, 0], [40, 0], [40, 20], [0, 20]], "File", 0.9]]
+        grounder = self._grounder(result)
+        screenshot = Screenshot(
+            image=Image.new("RGB", (64, 64)),
+            width=64,
+            height=64,
+            timestamp=0.0,
+            monitor_index=0,
+            capture_time_ms=0.0,
+        )
+
+        assert grounder.detect_text_at(screenshot, 15, 8) == "File"
+        screenshot.image = Image.new("RGB", (64, 64), "white")
+        assert grounder.detect_text_at(screenshot, 15, 8) == "File"
+        assert grounder._ocr_engine.call_count == 2
+
+        del screenshot
+        gc.collect()
+        assert grounder._indexed[0]() is None, "the cache must not keep the screenshot alive"
+
+    def test_get_all_text_reading_order(self):
+        result = [
+            [[[200, 100], [240, 100], [240, 120], [200, 120]], "line2-right", 0.9],
+            [[[60, 0], [100, 0], [100, 20], [60, 20]], "line1-right", 0.9],
+            [[[0, 100], [40, 100], [40, 120], [0, 120]], "line2-left", 0.9],
+            [[[0, 2], [40, 2], [40, 22], [0, 22]], "line1-left", 0.9],
+        ]
+        text = self._grounder(result).get_all_text(self._screenshot())
+        assert text.splitlines() == ["line1-left", "line1-right", "line2-left", "line2-right"]
+
+    def test_detect_downscales_and_maps_bboxes_back(self):
+        result = [[[[10, 20], [50, 20], [50, 40], [10, 40]], "File", 0.9]]
+        grounder = self._grounder(result)
+        screenshot = self._screenshot(width=2560, height=1440)
+        elements = grounder.detect(screenshot)
+
+        screenshot.image.resize.assert_called_once()
+        assert screenshot.image.resize.call_args[0][0] == (1280, 720)
+        screenshot.view_numpy.assert_not_called()
+        assert elements[0].bbox == (20, 40, 100, 80)
+
+    def test_engine_shared_across_instances(self):
+        from agenticos.grounding import ocr
+
+        fake_engine = MagicMock()
+        with patch.dict(ocr._ENGINES, {False: fake_engine}):
+            assert ocr.OCRGrounder()._get_engine() is fake_engine
+            assert ocr.OCRGrounder()._get_engine() is fake_engine
+
+
+class TestVisionGrounder:
+    """Tests for VisionGrounder response parsing."""
+
+    @pytest.fixture
+    def grounder(self):
+        from agenticos.grounding.visual import VisionGrounder
+
+        return VisionGrounder()
+
+    @pytest.fixture
+    def screenshot(self):
+        return MagicMock(width=1920, height=1080)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '[{"name": "OK", "control_type": "Button", "bbox": [10, 10, 50, 30]}]',
+            '```json\n[{"name": "OK", "control_type": "Button", "bbox": [10, 10, 50, 30]}]\n```',
+            'Here are the elements:\n[{"name": "OK", "control_type": "Button", '
+            '"bbox": [10, 10, 50, 30]}]\nDone.',
+        ],
+    )
+    def test_parse_response_extracts_array(self, grounder, screenshot, content):
+        elements = grounder._parse_response(content, screenshot)
+        assert len(elements) == 1
+        assert elements[0].name == "OK"
+        assert elements[0].bbox == (10, 10, 50, 30)
+        assert elements[0].center == (30, 20)
+
+    def test_parse_response_clamps_to_screen(self, grounder, screenshot):
+        content = '[{"name": "X", "bbox": [-5, 10, 2500, 1200]}]'
+        elements = grounder._parse_response(content, screenshot)
+        assert elements[0].bbox == (0, 10, 1920, 1080)
+        assert elements[0].control_type == "Unknown"
+
+    def test_parse_response_skips_malformed_bbox(self, grounder, screenshot):
+        content = (
+            '[{"name": "A", "bbox": [1, 2, 11, 12]}, {"name": "B", "bbox": [1, 2]},'
+            ' {"name": "C", "bbox": [5, "x", 9, 9]}, {"name": "D"}]'
+        )
+        elements = grounder._parse_response(content, screenshot)
+        assert [e.name for e in elements] == ["A", "D"]
+        assert [e.idx for e in elements] == [0, 3]
+        assert elements[1].bbox == (0, 0, 0, 0)
+
+    def test_tiled_detect_offsets_and_dedupes(self, screenshot):
+        from PIL import Image
+
+        from agenticos.grounding.visual import VisionGrounder
+
+        screenshot.image = Image.new("RGB", (1920, 1080))
+        grounder = VisionGrounder(tile_size=1024, tile_overlap=128)
+
+        async def fake_detect_one(tile):
+            # Every tile reports one button at the same tile-local position
+            return [
+                UIElement(
+                    name="btn", control_type="Button", bbox=(900, 100, 1000, 140), center=(950, 120)
+                )
+            ]
+
+        with patch.object(grounder, "_detect_one", side_effect=fake_detect_one) as one:
+            elements = asyncio.run(grounder.detect(screenshot))
+
+        assert one.call_count == 4  # 2 x 2 tiles
+        boxes = [e.bbox for e in elements]
+        assert (900, 100, 1000, 140) in boxes
+        assert (1796, 100, 1896, 140) in boxes  # offset by the second tile origin
+        assert [e.idx for e in elements] == list(range(len(elements)))
+
+    def test_suppress_duplicates_keeps_larger_box(self):
+        from agenticos.grounding.visual import _suppress_duplicates
+
+        small = UIElement(name="a", control_type="Button", bbox=(10, 10, 50, 30))
+        large = UIElement(name="a", control_type="Button", bbox=(10, 10, 52, 30))
+        other = UIElement(name="b", control_type="Button", bbox=(200, 10, 240, 30))
+        assert _suppress_duplicates([small, large, other]) == [large, other]
+
+    def test_detect_sync_reuses_background_loop(self, grounder, screenshot):
+        loops = []
+
+        async def fake_detect(shot):
+            loops.append(asyncio.get_running_loop())
+            return []
+
+        with patch.object(grounder, "detect", side_effect=fake_detect):
+            assert grounder.detect_sync(screenshot) == []
+            assert grounder.detect_sync(screenshot) == []
+        assert loops[0] is loops[1]
+
+    def test_parse_response_cache_returns_fresh_copies(self, grounder, screenshot):
+        content = '[{"name": "OK", "bbox": [10, 10, 50, 30]}]'
+        first = grounder._parse_response(content, screenshot)
+        first[0].bbox = (0, 0, 1, 1)
+        with patch("agenticos.grounding.visual._json_loads") as loads:
+            second = grounder._parse_response(content, screenshot)
+        loads.assert_not_called()
+        assert second[0].bbox == (10, 10, 50, 30)
+
+    def test_parse_response_salvages_truncated_array(self, grounder, screenshot):
+        content = (
+            '```json\n[{"name": "A {x}", "bbox": [1, 2, 11, 12]},'
+            ' {"name": "B \\"q\\"", "bbox": [5, 5, 9, 9]}, {"name": "C", "bbox": [1, 2'
+        )
+        elements = grounder._parse_response(content, screenshot)
+        assert [e.name for e in elements] == ["A {x}", 'B "q"']
+
+    def test_parse_response_garbage_still_raises(self, grounder, screenshot):
+        with pytest.raises(ValueError):
+            grounder._parse_response("no json here", screenshot)
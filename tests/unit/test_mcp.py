@@ -17,3 +17,22 @@ class TestMCPServer:
         except TypeError:
             # If FastMCP version doesn't support 'version' kwarg, that's a known issue
             pytest.skip("FastMCP version incompatibility")
+
+    @pytest.mark.parametrize(
+        ("button", "clicks", "expected"),
+        [
+            ("left", 1, "click"),
+            ("middle", 1, "click"),
+            ("right", 1, "right_click"),
+            ("right", 3, "right_click"),
+            ("right", 0, "right_click"),
+            ("left", 2, "double_click"),
+            ("x", 2, "double_click"),
+        ],
+    )
+    def test_click_action_dispatch(self, button, clicks, expected):
+        from agenticos.actions.compositor import Action
+        from agenticos.mcp.server import _click_action
+
+        factory, _ = _click_action(button, clicks)
+        assert factory == getattr(Action, expected)
@@ -1,5 +1,8 @@
 """Unit tests for observation modules."""
 
+import os
+import sys
+import time
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -8,58 +11,148 @@ from PIL import Image
 
 from agenticos.observation.screenshot import ScreenCapture, Screenshot
 
+# mss can only capture on Windows, macOS, or an X11 session
+_HAS_DISPLAY = sys.platform in ("win32", "darwin") or bool(os.environ.get("DISPLAY"))
+
+
+@pytest.fixture(scope="module")
+def screen_image():
+    """A 1080p solid-colour image, allocated once and shared (never modified)."""
+    return Image.new("RGB", (1920, 1080), color=(100, 150, 200))
+
+
+@pytest.fixture
+def screenshot(screen_image):
+    """A Screenshot over the shared image, with its own empty caches."""
+    return Screenshot(
+        image=screen_image,
+        width=1920,
+        height=1080,
+        timestamp=1000.0,
+        monitor_index=1,
+        capture_time_ms=5.0,
+    )
+
 
 class TestScreenshot:
     """Tests for the Screenshot data class."""
 
-    def setup_method(self):
-        """Create a test screenshot."""
-        self.image = Image.new("RGB", (1920, 1080), color=(100, 150, 200))
-        self.screenshot = Screenshot(
-            image=self.image,
-            width=1920,
-            height=1080,
-            timestamp=1000.0,
-            monitor_index=1,
-            capture_time_ms=5.0,
-        )
-
-    def test_to_numpy(self):
+    def test_to_numpy(self, screenshot):
         """Test numpy conversion."""
-        arr = self.screenshot.to_numpy()
+        arr = screenshot.to_numpy()
         assert isinstance(arr, np.ndarray)
         assert arr.shape == (1080, 1920, 3)
         assert arr.dtype == np.uint8
 
-    def test_to_numpy_cached(self):
+    def test_to_numpy_cached(self, screenshot):
         """Test that numpy result is cached."""
-        arr1 = self.screenshot.to_numpy()
-        arr2 = self.screenshot.to_numpy()
+        arr1 = screenshot.to_numpy()
+        arr2 = screenshot.to_numpy()
         assert arr1 is arr2
 
-    def test_to_base64(self):
+    def test_to_numpy_writable_view_numpy_read_only(self, screenshot):
+        arr = screenshot.to_numpy()
+        arr[0, 0] = 0  # callers may edit the copy in place
+        view = screenshot.view_numpy()
+        assert view.shape == arr.shape
+        assert not view.flags.writeable
+        assert screenshot.view_numpy() is view
+
+    def test_to_base64(self, screenshot):
         """Test base64 encoding."""
-        b64 = self.screenshot.to_base64()
+        b64 = screenshot.to_base64()
         assert isinstance(b64, str)
         assert len(b64) > 0
 
-    def test_to_base64_downscale(self):
+    def test_to_base64_cached(self, screenshot):
+        """Test that repeated calls with the same settings reuse the encoding."""
+        first = screenshot.to_base64(max_dimension=200)
+        with patch.object(Screenshot, "_encode") as mock_encode:
+            assert screenshot.to_base64(max_dimension=200) is first
+            mock_encode.assert_not_called()
+        assert screenshot.to_base64(max_dimension=100) != first
+
+    def test_replacing_image_drops_cached_encodings(self, screenshot):
+        """Test that assigning a new image invalidates derived caches."""
+        first = screenshot.to_base64(max_dimension=200)
+        arr = screenshot.to_numpy()
+        screenshot.image = Image.new("RGB", (screenshot.width, screenshot.height), "red")
+        assert screenshot.to_base64(max_dimension=200) != first
+        assert screenshot.to_numpy() is not arr
+        assert screenshot.view_numpy()[0, 0].tolist() == [255, 0, 0]
+
+    def test_to_base64_round_trips(self, screenshot):
+        """Test that the encoded string decodes back to the PNG bytes."""
+        import base64
+
+        b64 = screenshot.to_base64(max_dimension=5000)
+        assert base64.b64decode(b64) == screenshot.to_bytes()
+
+    def test_to_base64_jpeg(self, screenshot):
+        """Test JPEG encoding and quality setting."""
+        import base64
+
+        low = screenshot.to_base64(format="jpeg", max_dimension=5000, quality=10)
+        high = screenshot.to_base64(format="JPEG", max_dimension=5000, quality=95)
+        assert base64.b64decode(low)[:2] == b"\xff\xd8"
+        assert len(low) <= len(high)
+
+    def test_to_base64_downscale(self, screenshot):
         """Test that large images are downscaled."""
-        b64_small = self.screenshot.to_base64(max_dimension=100)
-        b64_large = self.screenshot.to_base64(max_dimension=5000)
+        b64_small = screenshot.to_base64(max_dimension=100)
+        b64_large = screenshot.to_base64(max_dimension=5000)
         # Smaller max_dimension should produce smaller base64
         assert len(b64_small) < len(b64_large)
 
-    def test_to_bytes(self):
+    def test_to_base64_downscale_size(self, screenshot):
+        """Test that the longest edge is scaled to max_dimension."""
+        import base64
+        import io
+
+        b64 = screenshot.to_base64(max_dimension=480)
+        img = Image.open(io.BytesIO(base64.b64decode(b64)))
+        assert img.size == (480, 270)
+
+    def test_crop(self, screenshot):
+        """Test cropping keeps metadata and sizes the region."""
+        region = screenshot.crop((10, 20, 74, 84))
+        assert (region.width, region.height) == (64, 64)
+        assert region.timestamp == screenshot.timestamp
+
+    def test_tile_digests_detect_changes(self, screenshot, screen_image):
+        """Test that only the modified tile's digest changes."""
+        before = screenshot.tile_digests(64)
+        assert len(before) == 30 * 17  # 1080 / 64 leaves a partial last row
+        image = screen_image.copy()
+        image.putpixel((130, 70), (0, 0, 0))
+        after = Screenshot(image, 1920, 1080, 1001.0, 1, 5.0).tile_digests(64)
+        assert [k for k in before if before[k] != after[k]] == [(128, 64)]
+
+    def test_to_bytes(self, screenshot):
         """Test bytes encoding."""
-        data = self.screenshot.to_bytes()
+        data = screenshot.to_bytes()
         assert isinstance(data, bytes)
         assert len(data) > 0
 
-    def test_save(self, tmp_path):
+    def test_to_memoryview_matches_bytes(self, screenshot):
+        """Test the zero-copy view holds the same encoded data."""
+        view = screenshot.to_memoryview(max_dimension=200)
+        assert view.readonly
+        assert view == screenshot.to_bytes(max_dimension=200)
+
+    def test_to_bytes_downscale_jpeg(self, screenshot):
+        """Test encoded bytes honour max_dimension and format."""
+        import io
+
+        data = screenshot.to_bytes(format="JPEG", max_dimension=960)
+        img = Image.open(io.BytesIO(data))
+        assert img.format == "JPEG"
+        assert img.size == (960, 540)
+
+    def test_save(self, screenshot, tmp_path):
         """Test saving to file."""
         path = str(tmp_path / "test.png")
-        self.screenshot.save(path)
+        screenshot.save(path)
         # Verify file exists and is a valid image
         loaded = Image.open(path)
         assert loaded.size == (1920, 1080)
@@ -74,7 +167,7 @@ class TestScreenCapture:
         assert capture.monitor == 1
         assert capture.scale == 0.5
 
-    @patch("agenticos.observation.screenshot.mss.mss")
+    @patch("mss.mss")
     def test_grab(self, mock_mss_class):
         """Test screenshot capture."""
         # Mock mss
@@ -101,6 +194,27 @@ class TestScreenCapture:
         assert screenshot.width == 1920
         assert screenshot.height == 1080
         assert screenshot.capture_time_ms > 0
+        assert screenshot.image.getpixel((0, 0)) == (200, 150, 100)
+        assert screenshot.to_numpy()[0, 0].tolist() == [200, 150, 100]
+
+    @patch("mss.mss")
+    def test_grab_numpy(self, mock_mss_class):
+        """Test array capture, with and without scaling."""
+        mock_sct = MagicMock()
+        mock_mss_class.return_value = mock_sct
+        mock_sct.monitors = [{}, {"left": 0, "top": 0, "width": 8, "height": 4}]
+        mock_grab = MagicMock()
+        mock_grab.size = (8, 4)
+        mock_grab.bgra = bytes([100, 150, 200, 255] * 32)
+        mock_sct.grab.return_value = mock_grab
+
+        arr, elapsed_ms = ScreenCapture(monitor=1).grab_numpy()
+        assert arr.shape == (4, 8, 3)
+        assert arr[0, 0].tolist() == [200, 150, 100]
+        assert elapsed_ms >= 0
+
+        arr, _ = ScreenCapture(monitor=1, scale=0.5).grab_numpy()
+        assert arr.shape == (2, 4, 3)
 
     def test_context_manager(self):
         """Test context manager protocol."""
@@ -108,12 +222,156 @@ class TestScreenCapture:
         with capture as c:
             assert c is capture
 
+    @pytest.mark.skipif(not _HAS_DISPLAY, reason="No display available")
     def test_get_screen_size(self):
         """Test getting screen size (requires display)."""
-        try:
-            capture = ScreenCapture()
+        with ScreenCapture() as capture:
             w, h = capture.get_screen_size()
-            assert w > 0
-            assert h > 0
-        except Exception:
-            pytest.skip("No display available")
+        assert w > 0
+        assert h > 0
+
+
+class TestGifRecorder:
+    """Tests for the GifRecorder."""
+
+    def _recorder(self, images):
+        from agenticos.observation.recorder import GifRecorder, RecordingFrame
+
+        recorder = GifRecorder(fps=5, max_width=32)
+        recorder._frames = [RecordingFrame(image=img, timestamp=0.0) for img in images]
+        return recorder
+
+    def test_save_to_bytes_merges_identical_frames(self):
+        black = np.zeros((40, 64, 3), dtype=np.uint8)
+        white = np.full((40, 64, 3), 255, dtype=np.uint8)
+        data = self._recorder([black, black.copy(), white]).save_to_bytes()
+
+        import io
+
+        gif = Image.open(io.BytesIO(data))
+        assert gif.n_frames == 2
+        assert gif.size == (32, 20)
+        gif.seek(0)
+        assert gif.info["duration"] == 400
+        gif.seek(1)
+        assert gif.info["duration"] == 200
+
+    def test_save_to_bytes_keeps_flat_colours(self):
+        red = np.zeros((20, 32, 3), dtype=np.uint8)
+        red[..., 0] = 255
+        blue = np.zeros((20, 32, 3), dtype=np.uint8)
+        blue[..., 2] = 255
+        data = self._recorder([red, blue]).save_to_bytes()
+
+        import io
+
+        gif = Image.open(io.BytesIO(data))
+        assert gif.convert("RGB").getpixel((5, 5)) == (255, 0, 0)
+        gif.seek(1)
+        assert gif.convert("RGB").getpixel((5, 5)) == (0, 0, 255)
+
+    def test_save_to_bytes_partial_update_round_trips(self):
+        rng = np.random.default_rng(0)
+        first = rng.integers(0, 255, (40, 64, 3), dtype=np.uint8)
+        second = first.copy()
+        second[5:10, 5:10] = 0
+        recorder = self._recorder([first, second])
+        recorder.max_width = 64
+        data = recorder.save_to_bytes()
+
+        import io
+
+        gif = Image.open(io.BytesIO(data))
+        gif.seek(0)
+        shown_first = np.asarray(gif.convert("RGB"))
+        gif.seek(1)
+        shown_second = np.asarray(gif.convert("RGB"))
+        assert (shown_second[5:10, 5:10] == 0).all()
+        assert np.array_equal(shown_second[20:], shown_first[20:])
+
+    def test_overlay_text_draws_bar(self):
+        frame = np.full((100, 200, 3), 255, dtype=np.uint8)
+        out = self._recorder([])._overlay_text(frame, "Clicking Save")
+        assert out.shape == frame.shape
+        assert out[0, 0].tolist() == [255, 255, 255]
+        assert out[-1, -1].tolist() == [0, 0, 0]
+
+    def test_record_pipeline_downscales_frames(self):
+        from agenticos.observation.recorder import GifRecorder
+
+        recorder = GifRecorder(fps=50, max_duration=1, max_width=32)
+        frame = np.zeros((40, 64, 3), dtype=np.uint8)
+        with patch.object(recorder._capture, "grab_numpy", return_value=(frame, 1.0)):
+            recorder.start()
+            time.sleep(0.1)
+            recorder.stop()
+        assert recorder.frame_count > 0
+        assert recorder._frames[0].image.shape == (20, 32, 3)
+        assert recorder._frame_ratio == 0.5
+
+    def test_record_loop_folds_unchanged_frames(self):
+        from agenticos.observation.recorder import GifRecorder
+
+        recorder = GifRecorder(fps=50, max_duration=1, max_width=64)
+        frame = np.zeros((40, 64, 3), dtype=np.uint8)
+        with patch.object(recorder._capture, "grab_numpy", return_value=(frame, 1.0)):
+            recorder.start()
+            time.sleep(0.1)
+            recorder.stop()
+        assert recorder.frame_count == 1
+        assert recorder._frames[0].repeats > 1
+        _, durations = recorder._processed_frames()
+        assert durations == [20 * recorder._frames[0].repeats]
+
+    def test_record_loop_paces_failed_captures(self):
+        from agenticos.observation.recorder import GifRecorder
+
+        recorder = GifRecorder(fps=20, max_duration=1)
+        grab = MagicMock(side_effect=OSError("no display"))
+        with patch.object(recorder._capture, "grab_numpy", grab):
+            recorder.start()
+            time.sleep(0.2)
+            recorder.stop()
+        assert recorder.frame_count == 0
+        assert grab.call_count <= 6  # one attempt per 50 ms slot, not a busy loop
+
+    def test_processed_frames_tolerates_concurrent_appends(self):
+        from collections import deque
+
+        from agenticos.observation.recorder import RecordingFrame
+
+        black = np.zeros((8, 16, 3), dtype=np.uint8)
+        recorder = self._recorder([])
+
+        class AppendingFrame:
+            """A frame whose read races with the encoder appending a new one."""
+
+            repeats = 1
+
+            @property
+            def image(self):
+                recorder._frames.append(RecordingFrame(image=black, timestamp=0.0))
+                return black
+
+        recorder._frames = deque([AppendingFrame(), AppendingFrame()])
+        frames, durations = recorder._processed_frames()
+        assert len(frames) == 1
+        assert durations == [400]
+
+    def test_frames_capped_at_duration(self):
+        from agenticos.observation.recorder import GifRecorder
+
+        recorder = GifRecorder(fps=2, max_duration=3)
+        assert recorder._frames.maxlen == 6
+
+    def test_bounding_box_scaled_to_stored_frame(self):
+        recorder = self._recorder([np.zeros((20, 32, 3), dtype=np.uint8)])
+        recorder._frame_ratio = 0.5
+        recorder.add_bounding_box(0, (20, 10, 40, 30), color="white")
+        image = recorder._frames[0].image
+        assert image[5, 10].tolist() == [255, 255, 255]
+        assert not image[:, 21:].any()
+
+    def test_save_without_frames_raises(self):
+        with pytest.raises(ValueError):
+            self._recorder([]).save_to_bytes()
@@ -2,7 +2,13 @@
 
 import pytest
 
-from agenticos.utils.config import AgenticOSConfig, GroundingMode, LLMProvider
+from agenticos.utils.config import (
+    AgenticOSConfig,
+    GroundingMode,
+    LLMProvider,
+    get_config,
+    reset_config,
+)
 from agenticos.utils.exceptions import (
     ActionBlockedError,
     ActionError,
@@ -34,6 +40,29 @@ class TestConfig:
         assert config.grounding_mode == GroundingMode.UIA
         assert config.confirm_actions is False
 
+    def test_config_fixture(self, config):
+        assert config.max_steps == 5
+        assert config.grounding_mode == GroundingMode.UIA
+
+    def test_config_fixture_is_a_copy(self, config, session_config):
+        config.max_steps = 99
+        assert config is not session_config
+        assert session_config.max_steps == 5
+
+    def test_get_config_cached(self, monkeypatch):
+        reset_config()
+        monkeypatch.setenv("AGENTICOS_MAX_STEPS", "7")
+        try:
+            config = get_config()
+            assert config is get_config()
+            assert config.max_steps == 7
+            monkeypatch.setenv("AGENTICOS_MAX_STEPS", "9")
+            assert get_config().max_steps == 7
+            reset_config()
+            assert get_config().max_steps == 9
+        finally:
+            reset_config()
+
 
 class TestExceptions:
     """Tests for custom exceptions."""